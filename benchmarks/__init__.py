@@ -0,0 +1,6 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 14:02:37 2026
+
+@author: Reuben
+"""
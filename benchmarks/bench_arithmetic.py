@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 10:14:48 2026
+
+@author: Reuben
+
+Benchmark for Quantity arithmetic with `settings['always_make_quantities']`
+enabled, as it would be during dimensional checks in unittests. It reports
+operations per second for scalar and array operands, alongside the rate for
+plain floats and arrays.
+
+Run from the repository root with::
+    
+    python -m benchmarks.bench_arithmetic
+
+"""
+
+import timeit
+import numpy as np
+import unitty
+
+
+def rate(stmt, number):
+    t = min(timeit.repeat(stmt, number=number, repeat=5))
+    return number / t
+
+
+def report(name, q1, q2, number):
+    ops = {'q * 2.5': lambda: q1 * 2.5,
+           '2.5 * q': lambda: 2.5 * q1,
+           'q / 2.5': lambda: q1 / 2.5,
+           'q * q': lambda: q1 * q2,
+           'q / q': lambda: q1 / q2,
+           'q + q': lambda: q1 + q1,
+           'q ** 2': lambda: q1 ** 2}
+    v1 = q1.value
+    v2 = q2.value
+    plain = rate(lambda: v1 * v2, number)
+    print(name)
+    print('    {:8s} {:12.0f} ops/s'.format('plain', plain))
+    for k, f in ops.items():
+        r = rate(f, number)
+        print('    {:8s} {:12.0f} ops/s ({:0.1f}x slower than plain)'.format(
+            k, r, plain / r))
+
+
+def main(number=20000):
+    u = unitty.get_units()
+    unitty.settings['always_make_quantities'] = True
+    try:
+        q1 = 2.0 << u.m
+        q2 = 3.0 << u.s
+        report('Scalar operands', q1, q2, number)
+        a = np.linspace(1, 2, 100)
+        q1 = a << u.m
+        q2 = a << u.s
+        report('Array operands (100 elements)', q1, q2, number)
+    finally:
+        unitty.settings['always_make_quantities'] = False
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 12:02:15 2026
+
+@author: Reuben
+
+Benchmark for converting columns of values into given units. It compares
+calling `Systems.unitise_typed` once per value with a single call to
+`Systems.unitise_typed_batch` for all columns.
+
+Run from the repository root with::
+    
+    python -m benchmarks.bench_batch
+
+"""
+
+import time
+import numpy as np
+import unitty
+
+
+def main(n_rows=100000):
+    s = unitty.get_systems()
+    u = unitty.get_units()
+    units = ['mm', 'kPa', 'kg/s', 'N.m', 'W/m2']
+    groups = [(np.random.rand(n_rows), unit) for unit in units]
+    t0 = time.perf_counter()
+    for vals, unit in groups:
+        spec = u[unit].spec
+        for v in vals[:10000]:
+            s.unitise_typed(v, spec)
+    per_value = (time.perf_counter() - t0) / (10000 * len(units))
+    t0 = time.perf_counter()
+    s.unitise_typed_batch(groups)
+    batch = (time.perf_counter() - t0) / (n_rows * len(units))
+    print('{} columns of {} values'.format(len(units), n_rows))
+    print('    per value: {:10.0f} values/s'.format(1 / per_value))
+    print('    batch:     {:10.0f} values/s ({:0.0f}x faster)'.format(
+        1 / batch, per_value / batch))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 12:31:50 2026
+
+@author: Reuben
+
+Benchmark for converting values between two named units. It compares
+`Units.convert` with converting through Quantities using `<<` and `>>`.
+
+Run from the repository root with::
+    
+    python -m benchmarks.bench_convert
+
+"""
+
+import timeit
+import numpy as np
+import unitty
+
+
+def rate(stmt, number):
+    t = min(timeit.repeat(stmt, number=number, repeat=5))
+    return number / t
+
+
+def main(number=20000):
+    u = unitty.get_units()
+    for name, vals in [('Scalar', 14.7),
+                       ('Array (1000 elements)', np.linspace(0, 100, 1000))]:
+        quantities = rate(lambda: vals << u.psi >> u.kPa, number)
+        convert = rate(lambda: u.convert(vals, 'psi', 'kPa'), number)
+        print(name)
+        print('    << and >>: {:10.0f} conversions/s'.format(quantities))
+        print('    convert:   {:10.0f} conversions/s ({:0.1f}x faster)'.format(
+            convert, convert / quantities))
+
+
+if __name__ == '__main__':
+    main()
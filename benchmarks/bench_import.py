@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 16:40:55 2026
+
+@author: Reuben
+
+Benchmark for the time taken to `import unitty` and for the first call to
+`unitty.get_units()`, which sets up the default units and systems. Each is
+measured in a fresh interpreter. The script exits with an error if either
+exceeds its threshold, so it can be used to catch regressions.
+
+Run from the repository root with::
+    
+    python -m benchmarks.bench_import
+
+"""
+
+import sys
+import subprocess
+
+IMPORT_LIMIT = 0.3 # seconds
+FIRST_UNITS_LIMIT = 0.3 # seconds
+
+CODE = '''
+import sys, time
+t0 = time.perf_counter()
+import unitty
+t1 = time.perf_counter()
+yaml_imported = 'ruamel.yaml' in sys.modules
+unitty.get_units()
+t2 = time.perf_counter()
+print(t1 - t0, t2 - t1, yaml_imported)
+'''
+
+
+def measure(repeat=5):
+    results = []
+    for k in range(repeat):
+        out = subprocess.run([sys.executable, '-c', CODE], check=True,
+                             capture_output=True, text=True).stdout.split()
+        results.append((float(out[0]), float(out[1]), out[2] == 'True'))
+    t_import = min(r[0] for r in results)
+    t_units = min(r[1] for r in results)
+    yaml_imported = any(r[2] for r in results)
+    return t_import, t_units, yaml_imported
+
+
+def main():
+    t_import, t_units, yaml_imported = measure()
+    print('import unitty:       {:6.1f} ms (limit {:.0f} ms)'.format(
+        t_import * 1000, IMPORT_LIMIT * 1000))
+    print('first get_units():   {:6.1f} ms (limit {:.0f} ms)'.format(
+        t_units * 1000, FIRST_UNITS_LIMIT * 1000))
+    print('yaml imported by import unitty:', yaml_imported)
+    failed = (t_import > IMPORT_LIMIT or t_units > FIRST_UNITS_LIMIT
+              or yaml_imported)
+    if failed:
+        sys.exit('Import time regression')
+
+
+if __name__ == '__main__':
+    main()
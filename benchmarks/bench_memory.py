@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 16:40:52 2026
+
+@author: Reuben
+
+Memory benchmark for Quantity instances.
+
+It reports the bytes allocated per Quantity when many are created with
+`settings['always_make_quantities']` enabled. For comparison, it also
+reports the same figure for an equivalent object with an instance
+dictionary, a list spec and its own copy of the vector, which is how
+Quantity instances used to be laid out. It also reports how many Unit
+instances the default units create when they are set up.
+
+Run from the repository root with::
+    
+    python -m benchmarks.bench_memory
+
+"""
+
+import tracemalloc
+import unitty
+
+
+class DictQuantity():
+    def __init__(self, value, spec, vector, abbr=None, name=None,
+                 parent=None):
+        self.value = value
+        self.spec = spec
+        self.vector = vector
+        self.abbr = abbr
+        self.name = name
+        self._parent = parent
+        self._ref = None
+
+
+def measure(make, n):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    lst = [make(float(i)) for i in range(n)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / len(lst)
+
+
+def main(n=100000):
+    u = unitty.get_units()
+    print('Unit instances created at setup: {} of {} units'.format(
+        dict.__len__(u.units), len(u.units)))
+    unitty.settings['always_make_quantities'] = True
+    try:
+        m = u.m
+        slotted = measure(lambda v: v * m, n)
+        spd = u.m / u.s
+        slotted_compound = measure(lambda v: v * spd, n)
+    finally:
+        unitty.settings['always_make_quantities'] = False
+    spec = list(m.spec)
+    dict_based = measure(lambda v: DictQuantity(v, list(spec),
+                                                m.vector.copy()), n)
+    spec = list(spd.spec)
+    dict_compound = measure(lambda v: DictQuantity(v, list(spec),
+                                                   spd.vector.copy()), n)
+    print('Bytes per Quantity (m):   {:7.1f} (dict layout: {:7.1f})'.format(
+        slotted, dict_based))
+    print('Bytes per Quantity (m/s): {:7.1f} (dict layout: {:7.1f})'.format(
+        slotted_compound, dict_compound))
+
+
+if __name__ == '__main__':
+    main()
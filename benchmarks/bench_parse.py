@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 14:05:11 2026
+
+@author: Reuben
+
+Micro-benchmark for parsing unit strings with Units.spec_from_str.
+
+Run from the repository root with::
+    
+    python -m benchmarks.bench_parse
+
+"""
+
+import timeit
+import unitty
+
+CORPUS = ['kg', 'mm', 'N/kg', '1/kg', 's/(kg.m)', 's2', 'kg.m/s2',
+          'kg m/(s.s)', 'kg/(s2.m)', 'mm2/lbs', 'm.kg/s', 'W/m2', 'kN.m',
+          'lbs.s2/ft', 'kg.s2/m', 'J/(kg.K)', 'W/(m2.K)', 'mm/s2', 'L/min',
+          'kg/m3', 'N.m', 'm10', 'ft3/min', 'kPa.s', 'MPa']
+
+
+def main(number=20000):
+    u = unitty.get_units()
+    def run():
+        for s in CORPUS:
+            u.spec_from_str(s)
+    t = min(timeit.repeat(run, number=number // len(CORPUS), repeat=5))
+    n = (number // len(CORPUS)) * len(CORPUS)
+    print('Parsed {:d} unit strings in {:0.3f} s'.format(n, t))
+    print('Throughput: {:0.0f} strings/s'.format(n / t))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 14:41:08 2026
+
+@author: Reuben
+
+Benchmark for `utils.transform_list_of_dicts`. It compares transforming each
+record with `transform_dict` against transforming the list in one call, both
+in this process and shared between worker processes.
+
+Run from the repository root with::
+    
+    python -m benchmarks.bench_records
+
+"""
+
+import os
+import time
+import numpy as np
+from unitty import utils
+
+
+KEYS = ['widget.length [mm]', 'widget.mass [lbs]', 'flow [kg/s]',
+        'stress [MPa]', 'heat.flux [W/m2]', 'torque [N.m]']
+
+
+def main(n_records=20000):
+    values = np.random.rand(n_records, len(KEYS)) * 100
+    lst = [dict(zip(KEYS, row.tolist())) for row in values]
+    t0 = time.perf_counter()
+    [utils.transform_dict(dct) for dct in lst]
+    t_dict = time.perf_counter() - t0
+    print('{} records of {} keys'.format(n_records, len(KEYS)))
+    print('    transform_dict:   {:8.0f} records/s'.format(n_records / t_dict))
+    for processes in (None, os.cpu_count()):
+        t0 = time.perf_counter()
+        utils.transform_list_of_dicts(lst, processes=processes)
+        t = time.perf_counter() - t0
+        print('    processes={}: {:8.0f} records/s ({:0.1f}x faster)'.format(
+            processes, n_records / t, t_dict / t))
+
+
+if __name__ == '__main__':
+    main()
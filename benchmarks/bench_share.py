@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 19:05:37 2026
+
+@author: Reuben
+
+Benchmark for the memory that forked worker processes copy from a parent
+that has set up the units.
+
+Each worker converts a value to every unit and prints it in the active
+system, then reports how much of its memory has become private (i.e.
+copied from the parent). That is done once with the units as they are set
+up, and once with the units frozen and `gc.freeze()` called before forking.
+
+Linux only. Run from the repository root with::
+
+    python -m benchmarks.bench_share
+
+"""
+
+import gc
+import multiprocessing as mp
+import unitty
+
+
+def private_kb():
+    with open('/proc/self/smaps_rollup') as f:
+        for line in f:
+            if line.startswith('Private_Dirty'):
+                return int(line.split()[1])
+
+
+def work(conn):
+    before = private_kb()
+    u = unitty.get_units()
+    for abbr in list(u.units):
+        (1.5 << u[abbr]).str_in_sys()
+    conn.send(private_kb() - before)
+
+
+def run(conn, freeze):
+    unitty.setup('default')
+    if freeze:
+        unitty.freeze()
+        gc.freeze()
+    ctx = mp.get_context('fork')
+    recv, send = ctx.Pipe(duplex=False)
+    p = ctx.Process(target=work, args=(send,))
+    p.start()
+    conn.send(recv.recv())
+    p.join()
+
+
+def measure(freeze):
+    ctx = mp.get_context('fork')
+    recv, send = ctx.Pipe(duplex=False)
+    p = ctx.Process(target=run, args=(send, freeze))
+    p.start()
+    out = recv.recv()
+    p.join()
+    return out
+
+
+def main():
+    print('Private memory per worker:')
+    print('  as set up: {:6d} kB'.format(measure(False)))
+    print('  frozen:    {:6d} kB'.format(measure(True)))
+
+
+if __name__ == '__main__':
+    main()
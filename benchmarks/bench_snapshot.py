@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 16:02:37 2026
+
+@author: Reuben
+
+Benchmark for starting up the default units and systems. It compares
+`unitty.setup`, which parses the yaml files and builds every unit, with
+loading a snapshot saved by `unitty.snapshot.save`.
+
+Run from the repository root with::
+    
+    python -m benchmarks.bench_snapshot
+
+"""
+
+import os
+import tempfile
+import timeit
+import warnings
+import unitty
+from unitty import snapshot
+
+
+def main(number=20):
+    warnings.simplefilter('ignore')
+    with tempfile.TemporaryDirectory() as tmp:
+        fname = os.path.join(tmp, 'default.npz')
+        unitty.setup('default')
+        snapshot.save(fname)
+        t_setup = min(timeit.repeat(lambda: unitty.setup('default'),
+                                    number=number, repeat=3)) / number
+        t_load = min(timeit.repeat(lambda: snapshot.load(fname),
+                                   number=number, repeat=3)) / number
+        size = os.path.getsize(fname)
+    print('setup:         {:8.2f} ms'.format(t_setup * 1000))
+    print('snapshot.load: {:8.2f} ms ({:0.1f}x faster, {} kB file)'.format(
+        t_load * 1000, t_setup / t_load, size // 1024))
+
+
+if __name__ == '__main__':
+    main()
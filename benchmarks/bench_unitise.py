@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 13:05:22 2026
+
+@author: Reuben
+
+Benchmark for choosing units for scalar values in `System._unitise_one`. It
+compares the decision table used for scalars with trying each unit in turn,
+and checks that both choose the same units for values spread over many
+orders of magnitude and at each breakpoint. It also reports the rate for
+`Quantity.in_sys` with and without `settings['cache_unitise']`.
+
+Run from the repository root with::
+    
+    python -m benchmarks.bench_unitise
+
+"""
+
+import time
+import numpy as np
+import unitty
+
+
+def rate(func, vals):
+    t0 = time.perf_counter()
+    for v in vals:
+        func(v)
+    return len(vals) / (time.perf_counter() - t0)
+
+
+def main(number=20000):
+    system = unitty.get_system()
+    units = unitty.get_units()
+    vals = list(10 ** np.random.uniform(-12, 12, number))
+    mismatches = 0
+    checked = 0
+    for utype in system._sys_dct:
+        for n in (-2, -1, 1, 2, 3):
+            breaks = system._decision_table(utype, n)[0]
+            trial_vals = vals[:2000] + [10 ** b for b in breaks]
+            for v in trial_vals:
+                checked += 1
+                if (system._unitise_one(v, utype, n) !=
+                        system._unitise_trials(v, utype, n)):
+                    mismatches += 1
+    print('Checked {} choices: {} mismatches'.format(checked, mismatches))
+    utype = units._ind('length')
+    trials = rate(lambda v: system._unitise_trials(v, utype, 1), vals)
+    table = rate(lambda v: system._unitise_one(v, utype, 1), vals)
+    print('Length units for scalars')
+    print('    trials:   {:10.0f} values/s'.format(trials))
+    print('    table:    {:10.0f} values/s ({:0.0f}x faster)'.format(
+        table, table / trials))
+    q = 1234.5 << units.kN / units.mm2
+    for cached in (False, True):
+        unitty.settings['cache_unitise'] = cached
+        try:
+            t0 = time.perf_counter()
+            for k in range(number):
+                q.in_sys()
+            t = time.perf_counter() - t0
+        finally:
+            unitty.settings['cache_unitise'] = False
+        print('Quantity.in_sys for kN/mm2 (cache_unitise={}): '
+              '{:10.0f} calls/s'.format(cached, number / t))
+    print('Cache statistics:', unitty.get_systems().cache_info())
+
+
+if __name__ == '__main__':
+    main()
@@ -5,7 +5,9 @@ Created on Tue May  5 09:46:59 2020
 @author: Reuben
 """
 
+import sys
 import unittest
+import threading
 from unitty import base
 import numpy as np
 
@@ -132,7 +134,7 @@ class Test_Units(unittest.TestCase):
         u = b.mm
         self.assertEqual(u.value, 0.001)        
         mm_ind = b._ind('mm')
-        self.assertSequenceEqual(u.spec, [mm_ind])
+        self.assertSequenceEqual(u.spec, ((mm_ind, 1),))
         
     def test_getitem_mm(self):
         b = base.Units(raw=TEST_DICT_2)
@@ -156,11 +158,11 @@ class Test_Units(unittest.TestCase):
     def test_str_spec(self):
         b = base.Units(raw=TEST_DICT_4)
         N_p_mm = b.N / b.mm
-        ind_N = b.N.spec[0]
-        ind_mm = b.mm.spec[0]
+        ind_N = b.N.spec[0][0]
+        ind_mm = b.mm.spec[0][0]
         self.assertEqual(N_p_mm.value, 1000.0)
         self.assertEqual(N_p_mm.abbr, None)
-        self.assertEqual(N_p_mm.spec, [ind_N, -ind_mm])
+        self.assertEqual(dict(N_p_mm.spec), {ind_N: 1, ind_mm: -1})
         s = b.str_spec(N_p_mm.spec)
         self.assertEqual(s, 'N/mm')
         
@@ -212,8 +214,18 @@ class Test_Units(unittest.TestCase):
         s = 'm/s2'
         unit = b.from_str(s)
         self.assertEqual(unit.abbr, s)
-        self.assertTrue(unit.abbr, b.units)
+        self.assertEqual(len(b.units), n_current)
+        self.assertTrue(len(b.cache) > 0)
+        
+    def test_from_str_pin(self):
+        b = base.Units(raw=TEST_DICT_4)
+        n_current = len(b.units)
+        s = 'm/s2'
+        unit = b.from_str(s, pin=True)
+        self.assertEqual(unit.abbr, s)
+        self.assertTrue(unit.abbr in b.units)
         self.assertEqual(len(b.units), n_current + 2)
+        self.assertEqual(len(b.cache), 0)
 
     def test_from_str_2(self):
         b = base.Units(raw=TEST_DICT_5)
@@ -236,3 +248,194 @@ class Test_Units(unittest.TestCase):
         unit = b[s, ref]
         self.assertEqual(unit.abbr, s)
         self.assertEqual(unit._ref, ref)
+
+    def test_cache_hit(self):
+        b = base.Units(raw=TEST_DICT_4)
+        unit = b['kg/(s2.m)']
+        self.assertEqual(b.cache.info()['hits'], 0)
+        unit2 = b['kg / (s2 . m)']
+        self.assertIs(unit, unit2)
+        self.assertEqual(b.cache.info()['hits'], 1)
+        
+    def test_cache_one_lookup(self):
+        b = base.Units(raw=TEST_DICT_4)
+        unit = b['m.kg/s2']
+        self.assertEqual(b.cache.info()['misses'], 1)
+        self.assertEqual(len(b.cache), 1)
+        self.assertIs(b['kg.m/s2'], unit)
+        info = b.cache.info()
+        self.assertEqual((info['hits'], info['misses']), (1, 1))
+        self.assertEqual(info['hit_rate'], 0.5)
+        
+    def test_cache_eviction(self):
+        b = base.Units(raw=TEST_DICT_4)
+        b.cache.maxsize = 2
+        n_current = len(b.units)
+        unit = b['m/s']
+        b['m/s2']
+        b['kg/s']
+        self.assertEqual(len(b.cache), 2)
+        self.assertFalse(b.spec_from_str('m/s') in b.cache)
+        self.assertEqual(len(b.units), n_current)
+        self.assertEqual(b['m/s'].value, unit.value)
+        self.assertIs(b['mm'], b.units['mm'])
+
+    def test_from_str_not_defined_unit(self):
+        u = base.Units()
+        self.assertAlmostEqual(u['mm2'].value, 1e-3) # SI prefix on m2
+        self.assertEqual(u['mm.mm'].value, 1e-6)
+        self.assertAlmostEqual(u['cm.cm'].value, 1e-4)
+        self.assertEqual(u['mm.mm'].abbr, 'mm.mm')
+        self.assertIsNot(u['mm.mm'], u['mm2'])
+
+    def test_canonical(self):
+        b = base.Units(raw=TEST_DICT_4)
+        self.assertEqual(b.canonical('m.kg/s2'), 'kg.m/s2')
+        self.assertEqual(b.canonical('kg m/(s.s)'), 'kg.m/s2')
+        
+    def test_canonical_shared(self):
+        b = base.Units(raw=TEST_DICT_4)
+        u1 = b['m.kg/s2']
+        u2 = b['kg.m/s2']
+        u3 = b['kg m/(s.s)']
+        self.assertIs(u1, u2)
+        self.assertIs(u1, u3)
+        self.assertEqual(u1.abbr, 'kg.m/s2')
+
+    def test_spec_from_str_multi_digit(self):
+        b = base.Units(raw=TEST_DICT_4)
+        spec = b.spec_from_str('m10/s12')
+        m = b._ind('m')
+        s = b._ind('s')
+        self.assertEqual(spec, ((m, 10), (s, -12)))
+
+    def test_spec_from_str_spaces(self):
+        b = base.Units(raw=TEST_DICT_4)
+        spec = b.spec_from_str(' kg  m / ( s . s ) ')
+        self.assertEqual(b.str_spec(spec), 'kg.m/s2')
+
+    def test_spec_from_str_errors(self):
+        b = base.Units(raw=TEST_DICT_4)
+        cases = {'m-s': 'negatives are not allowed',
+                 'm^2': 'power symbols',
+                 'kg/(s': 'matching number of open and close brackets',
+                 'kg/((s))': 'Only one set of brackets',
+                 '(kg)/(s)': 'Only one set of brackets',
+                 'kg/s/m': 'at most one divide symbol',
+                 'xyz2': 'Unit "xyz" not recognised'}
+        for s, msg in cases.items():
+            with self.assertRaises(ValueError) as cm:
+                b.spec_from_str(s)
+            self.assertIn(msg, str(cm.exception))
+
+    def test_shared_vectors(self):
+        b = base.Units(raw=TEST_DICT_2)
+        self.assertIs(b.m.vector, b.mm.vector)
+        self.assertIs(b['-m'].vector, b['-mm'].vector)
+        self.assertIs(b['mm2'].vector, b['m2'].vector)
+        with self.assertRaises(ValueError):
+            b.m.vector[0] = 2
+
+    def test_si_prefixed_spec(self):
+        b = base.Units(raw=TEST_DICT_6)
+        cm_ind = b._ind('cm')
+        self.assertEqual(b.cm.spec, ((cm_ind, 1),))
+        self.assertEqual(b['-cm'].spec, ((cm_ind, -1),))
+
+    def test_convert(self):
+        b = base.Units(raw=TEST_DICT_5)
+        a = np.array([1.0, 2.0, 3.0])
+        np.testing.assert_allclose(b.convert(a, 'ft', 'in'), a * 12)
+        np.testing.assert_allclose(b.convert(a, 'in', 'm'), a * 0.0254)
+        self.assertAlmostEqual(b.convert(2, 'm/lbs', 'in/kg'),
+                               2 / 0.0254 / 0.45359237)
+        with self.assertRaises(ValueError):
+            b.convert(a, 'm', 'kg')
+
+    def test_factor_table_rebuilt(self):
+        b = base.Units(raw=TEST_DICT_5)
+        pos, table = b.factor_table(b.m.vector)
+        self.assertEqual(len(pos), 5) # Including the 'length' type
+        self.assertIs(b.factor_table(b.m.vector)[1], table)
+        b.from_str('m2', pin=True)
+        pos, table = b.factor_table(b.m2.vector)
+        self.assertEqual(len(pos), 1)
+        b.from_str('in.ft', pin=True)
+        pos, table = b.factor_table(b.m2.vector)
+        self.assertEqual(len(pos), 2)
+        self.assertAlmostEqual(b.convert(1, 'in.ft', 'm2'), 0.0254 * 0.3048)
+
+    def test_str_spec_cached(self):
+        b = base.Units(raw=TEST_DICT_4)
+        spec = b['kg.m/s2'].spec
+        self.assertEqual(b.str_spec(spec), 'kg.m/s2')
+        self.assertEqual(b.str_spec(spec), 'kg.m/s2')
+        self.assertEqual(b._spec_strs.info()['hits'], 2) # Also formatted in from_str
+        self.assertEqual(b.str_spec(()), 'dimensionless')
+        self.assertEqual(b.str_spec(None), 'base')
+
+    def test_lazy_units(self):
+        b = base.Units(raw=TEST_DICT_6)
+        self.assertEqual(len(b.units), (2+6)*2) # Including cm
+        self.assertIn('-cm', b.units)
+        self.assertIn('-m', b.units)
+        created = dict(dict.items(b.units))
+        self.assertNotIn('-cm', created)
+        self.assertNotIn('-m', created)
+        inv_cm = b.get_by_index(-b._ind('cm'))
+        self.assertIs(b['-cm'], inv_cm)
+        self.assertAlmostEqual(b['-cm'].value, 100)
+        self.assertIs(b['-cm'].vector, b['-m'].vector)
+        self.assertEqual(len(b.units), (2+6)*2)
+        self.assertEqual(set(b.units), set(dict(b.units.items())))
+        
+    def test_lazy_units_threads(self):
+        n_threads = 8
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6) # Switch threads as often as possible
+        self.addCleanup(sys.setswitchinterval, interval)
+        for trial in range(20):
+            b = base.Units()
+            if trial % 2:
+                b.freeze()
+            indices = [i for i, abbr in b._num_dct.items() 
+                       if abbr in b.units]
+            barrier = threading.Barrier(n_threads)
+            errors = []
+            def work():
+                barrier.wait()
+                try:
+                    for i in indices:
+                        b.get_by_index(i)
+                except Exception as e:
+                    errors.append(e)
+            threads = [threading.Thread(target=work) 
+                       for k in range(n_threads)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            self.assertEqual(errors, [])
+            self.assertEqual(len(b.units._lazy), 0)
+
+    def test_freeze(self):
+        b = base.Units(raw=TEST_DICT_6)
+        b.m
+        records = sorted(b.units.records(), key=lambda r: r[0])
+        b.freeze()
+        self.assertTrue(b.frozen)
+        self.assertEqual(len(b.units), (2+6)*2)
+        self.assertEqual(list(dict.keys(b.units)), [])
+        for (abbr, value, spec, vector, name), r in zip(
+                sorted(b.units.records(), key=lambda r: r[0]), records):
+            self.assertEqual((abbr, value, spec, name), r[:3] + r[4:])
+            np.testing.assert_array_equal(vector, r[3])
+        self.assertIs(b.m.vector, b.cm.vector)
+        self.assertFalse(b.m.vector.flags.writeable)
+        self.assertAlmostEqual(b['-cm'].value, 100)
+        self.assertAlmostEqual(b.convert(1, 'm', 'cm'), 100)
+        self.assertAlmostEqual(b['m/cm'].value, 100)
+        with self.assertRaises(TypeError):
+            b.from_str('m/cm', pin=True)
+        with self.assertRaises(TypeError):
+            b._num_dct[100] = 'x'
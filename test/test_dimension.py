@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 09:02:15 2026
+
+@author: Reuben
+"""
+
+import unittest
+import numpy as np
+import unitty
+from unitty import dimension
+
+from .test_base import TEST_DICT_4
+
+
+class Test_Dimensions(unittest.TestCase):
+    def test_intern(self):
+        d = dimension.Dimensions()
+        a = d.intern(np.array([1, 0, 0]))
+        b = d.intern([1.0, 0.0, 0.0])
+        self.assertIs(a, b)
+        self.assertFalse(a.flags.writeable)
+        self.assertEqual(len(d), 1)
+        
+    def test_key(self):
+        d = dimension.Dimensions()
+        a = d.intern([1, 0])
+        b = d.intern([0, 1])
+        self.assertEqual(d.key(a), 0)
+        self.assertEqual(d.key(b), 1)
+        self.assertEqual(d.key(np.array([0, 1])), 1)
+        
+    def test_mul_div_inv(self):
+        d = dimension.Dimensions()
+        a = d.intern([1, 0])
+        b = d.intern([0, 1])
+        ab = d.mul(a, b)
+        self.assertTrue(np.allclose(ab, [1, 1]))
+        self.assertIs(ab, d.mul(a, b))
+        self.assertIs(d.div(ab, b), a)
+        self.assertTrue(np.allclose(d.inv(a), [-1, 0]))
+        self.assertIs(d.inv(a), d.inv(a))
+        
+    def test_mul_not_interned(self):
+        d = dimension.Dimensions()
+        a = np.array([1, 0])
+        ab = d.mul(a, a)
+        self.assertTrue(np.allclose(ab, [2, 0]))
+        self.assertTrue(ab in d)
+        
+    def test_same(self):
+        a = np.array([1, 0])
+        self.assertTrue(dimension.same(a, a))
+        self.assertTrue(dimension.same(a, np.array([1.0, 0.0])))
+        self.assertFalse(dimension.same(a, np.array([0, 1])))
+
+    def test_quantity_vectors(self):
+        unitty.setup('test', units_raw=TEST_DICT_4,
+                     sys_raw={'metric': {'length': ['mm', 'm']}})
+        u = unitty.get_units('test')
+        q = u.N / u.mm
+        self.assertIs(q.vector, (u.kg / u.s / u.s).vector)
+        self.assertIs((u.m * u.m).vector, u['mm2'].vector)
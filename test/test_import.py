@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 16:52:10 2026
+
+@author: Reuben
+"""
+
+import unittest
+import subprocess
+import sys
+import os
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CODE = '''
+import sys
+import unitty
+print('ruamel.yaml' in sys.modules, 'unitty.utils' in sys.modules)
+unitty.get_units()
+print('ruamel.yaml' in sys.modules, unitty.utils.__name__)
+'''
+
+
+class Test_Import(unittest.TestCase):
+    
+    def test_lazy_imports(self):
+        out = subprocess.run([sys.executable, '-c', CODE], cwd=root,
+                             check=True, capture_output=True, text=True)
+        self.assertEqual(out.stdout.split(),
+                         ['False', 'False', 'True', 'unitty.utils'])
+    
+    def test_missing_attribute(self):
+        import unitty
+        with self.assertRaises(AttributeError):
+            unitty.not_a_module
@@ -7,6 +7,7 @@ Created on Tue May  5 10:12:00 2020
 
 import numpy as np
 import unittest
+import unitty
 from unitty.quantity import Quantity
 
 class Test_Quantity(unittest.TestCase):
@@ -19,11 +20,21 @@ class Test_Quantity(unittest.TestCase):
         q = Quantity(value=1.0, spec=[3, -7], vector=self.vector,
                      abbr='m', name='meter')
         self.assertEqual(q.value, 1.0)
-        self.assertSequenceEqual(q.spec, [3, -7])
+        self.assertSequenceEqual(q.spec, ((3, 1), (7, -1)))
         self.assertTrue(np.allclose(self.vector, q.vector))
         self.assertEqual(q.abbr, 'm')
         self.assertEqual(q.name, 'meter')
         
+    def test_init_pairs(self):
+        q = Quantity(value=1.0, spec=[(7, -1), (3, 2)], vector=self.vector)
+        self.assertSequenceEqual(q.spec, ((3, 2), (7, -1)))
+
+    def test_slots(self):
+        q = Quantity(value=1.0, spec=[3, -7], vector=self.vector)
+        self.assertIsInstance(q.spec, tuple)
+        with self.assertRaises(AttributeError):
+            q.other = 5
+        
     def test_set_units_valid(self):
         q = Quantity(value=1.0, spec=[3], vector=self.vector,
                      abbr='m', name='meter')
@@ -31,7 +42,7 @@ class Test_Quantity(unittest.TestCase):
                      abbr='mm', name='millimeter')
         q.set_units(q2)
         self.assertEqual(q.value, 1.0)
-        self.assertSequenceEqual(q.spec, [8])
+        self.assertSequenceEqual(q.spec, ((8, 1),))
         self.assertTrue(np.allclose(self.vector, q.vector))
         self.assertEqual(q.abbr, 'mm')
         self.assertEqual(q.name, 'millimeter')
@@ -51,7 +62,7 @@ class Test_Quantity(unittest.TestCase):
                      abbr='mm', name='millimeter')
         q = q1 * q1
         self.assertEqual(q.value, 0.000001)
-        self.assertSequenceEqual(q.spec, [3, 3])
+        self.assertSequenceEqual(q.spec, ((3, 2),))
         self.assertTrue(np.allclose(self.vector*2, q.vector))
         self.assertEqual(q.abbr, None)
         self.assertEqual(q.name, None)
@@ -75,7 +86,7 @@ class Test_Quantity(unittest.TestCase):
                      abbr='mm', name='millimeter')
         q = q1 / q2
         self.assertEqual(q.value, 1000.0)
-        self.assertSequenceEqual(q.spec, [1, -3])
+        self.assertSequenceEqual(q.spec, ((1, 1), (3, -1)))
         self.assertTrue(np.allclose(self.vector*0, q.vector))
         self.assertEqual(q.abbr, None)
         self.assertEqual(q.name, None)
@@ -97,7 +108,7 @@ class Test_Quantity(unittest.TestCase):
                      abbr='mm', name='millimeter')
         q = 5 << q1
         self.assertEqual(q.value, 0.005)
-        self.assertSequenceEqual(q.spec, [3])
+        self.assertSequenceEqual(q.spec, ((3, 1),))
         self.assertTrue(np.allclose(self.vector, q.vector))
         self.assertEqual(q.abbr, None)
         self.assertEqual(q.name, None)
@@ -128,3 +139,82 @@ class Test_Quantity(unittest.TestCase):
         q = q1 * q2
         self.assertEqual(q.value, (1.7)*(0.0254*12)) # 0.51816
 
+    def test_numpy_scalar_divide(self):
+        q1 = Quantity(value=0.001, spec=[3], vector=self.vector,
+                     abbr='mm', name='millimeter')
+        q = np.float64(5) / q1
+        self.assertEqual(q, 5/0.001)
+        q = np.float64(5) * q1
+        self.assertEqual(q, 5*0.001)
+
+    def test_always_make_quantities(self):
+        unitty.settings['always_make_quantities'] = True
+        try:
+            q1 = Quantity(value=0.001, spec=[3], vector=self.vector,
+                         abbr='mm', name='millimeter')
+            q = 5 / q1
+            self.assertEqual(q.value, 5/0.001)
+            self.assertSequenceEqual(q.spec, ((3, -1),))
+            self.assertTrue(np.allclose(-1.0 * self.vector, q.vector))
+            q = np.float64(5) / q1
+            self.assertSequenceEqual(q.spec, ((3, -1),))
+            q = q1 * 5
+            self.assertEqual(q.value, 0.005)
+            self.assertSequenceEqual(q.spec, ((3, 1),))
+            q = (q1 / q1) / q1
+            self.assertSequenceEqual(q.spec, ((3, -1),))
+            self.assertTrue(np.allclose(-1.0 * self.vector, q.vector))
+        finally:
+            unitty.settings['always_make_quantities'] = False
+
+    def test_cancel(self):
+        q1 = Quantity(value=0.001, spec=[3], vector=self.vector,
+                     abbr='mm', name='millimeter')
+        q2 = Quantity(value=2.0, spec=[5], vector=self.vector * 2,
+                     abbr='s', name='second')
+        q = q1 * q2 / q1
+        self.assertAlmostEqual(q.value, 2.0)
+        self.assertSequenceEqual(q.spec, ((5, 1),))
+        q = q1 / q2 * q2 * q1 / q1
+        self.assertSequenceEqual(q.spec, ((3, 1),))
+
+    def test_long_chain(self):
+        q1 = Quantity(value=2.0, spec=[3], vector=self.vector,
+                     abbr='mm', name='millimeter')
+        q = q1
+        for i in range(50):
+            q = q * q1
+        self.assertSequenceEqual(q.spec, ((3, 51),))
+        for i in range(50):
+            q = q / q1
+        self.assertSequenceEqual(q.spec, ((3, 1),))
+
+    def test_pow(self):
+        q1 = Quantity(value=0.001, spec=[3, -5], vector=self.vector,
+                     abbr='mm', name='millimeter')
+        q = q1 ** 3
+        self.assertAlmostEqual(q.value, 1e-9)
+        self.assertSequenceEqual(q.spec, ((3, 3), (5, -3)))
+        self.assertTrue(np.allclose(self.vector * 3, q.vector))
+        
+    def test_pow_negative(self):
+        q1 = Quantity(value=0.001, spec=[3], vector=self.vector,
+                     abbr='mm', name='millimeter')
+        q = q1 ** -2
+        self.assertAlmostEqual(q.value, 1e6)
+        self.assertSequenceEqual(q.spec, ((3, -2),))
+        self.assertTrue(np.allclose(-2.0 * self.vector, q.vector))
+        
+    def test_pow_zero(self):
+        q1 = Quantity(value=0.001, spec=[3], vector=self.vector,
+                     abbr='mm', name='millimeter')
+        q = q1 ** 0
+        self.assertEqual(q.value, 1.0)
+        self.assertSequenceEqual(q.spec, [])
+        self.assertTrue(np.allclose(self.vector * 0, q.vector))
+        
+    def test_pow_invalid(self):
+        q1 = Quantity(value=0.001, spec=[3], vector=self.vector,
+                     abbr='mm', name='millimeter')
+        with self.assertRaises(ValueError):
+            q1 ** 1.5
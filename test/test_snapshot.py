@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 15:48:12 2026
+
+@author: Reuben
+"""
+
+import unittest
+import unitty
+from unitty import snapshot
+import numpy as np
+import os
+import tempfile
+
+from .test_system import TEST_DICT_10, TEST_SYSTEMS_1
+
+
+class Test_Snapshot(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.fname = os.path.join(self.tmp.name, 'snap.npz')
+        
+    def tearDown(self):
+        self.tmp.cleanup()
+    
+    def test_round_trip(self):
+        unitty.setup('default')
+        a = unitty.get_units('default')
+        a['kN/mm2'] # Derived units are not saved
+        snapshot.save(self.fname, 'default')
+        snapshot.load(self.fname, 'snap')
+        self.assertEqual(unitty.get_active(), 'snap')
+        b = unitty.get_units('snap')
+        self.assertEqual(a._num_dct, b._num_dct)
+        self.assertEqual(a._utypes, b._utypes)
+        self.assertEqual(a.bases, b.bases)
+        self.assertEqual(a.raw, b.raw)
+        self.assertEqual(list(a.units), list(b.units))
+        for k, ua in a.units.items():
+            ub = b.units[k]
+            self.assertEqual((ua.value, ua.spec, ua.name),
+                             (ub.value, ub.spec, ub.name))
+            np.testing.assert_array_equal(ua.vector, ub.vector)
+        self.assertIs(b.m.vector, b.mm.vector)
+        sa = unitty.get_systems('default')
+        sb = unitty.get_systems('snap')
+        for name, system in sa._sys_dct.items():
+            self.assertEqual(system._sys_dct, sb._sys_dct[name]._sys_dct)
+        q = 1234.5 << b['kN/mm2']
+        self.assertEqual(tuple(q.in_sys()),
+                         tuple((1234.5 << a['kN/mm2']).in_sys()))
+    
+    def test_raw(self):
+        unitty.setup('test', units_raw=TEST_DICT_10, sys_raw=TEST_SYSTEMS_1)
+        snapshot.save(self.fname)
+        snapshot.load(self.fname, 'test')
+        u = unitty.get_units('test')
+        self.assertEqual(u.raw, TEST_DICT_10)
+        unitty.set_system('US')
+        val, unit_str = (7 << u.ft / u.lbs).in_sys()
+        self.assertAlmostEqual(val, 7)
+        self.assertEqual(unit_str, 'ft/lbs')
+        
+    def test_out_of_date(self):
+        fname = os.path.join(unitty.base.root, 'units.yaml')
+        units_fname = os.path.join(self.tmp.name, 'units.yaml')
+        with open(fname, 'r') as f:
+            text = f.read()
+        with open(units_fname, 'w') as f:
+            f.write(text)
+        unitty.setup('test', units_fname=units_fname)
+        snapshot.save(self.fname)
+        snapshot.load(self.fname, 'test')
+        with open(units_fname, 'a') as f:
+            f.write('\n# A change\n')
+        with self.assertRaises(ValueError):
+            snapshot.load(self.fname, 'test')
+        snapshot.load(self.fname, 'test', check=False)
+        
+    def test_source_missing(self):
+        fname = os.path.join(unitty.base.root, 'units.yaml')
+        units_fname = os.path.join(self.tmp.name, 'units.yaml')
+        with open(fname, 'r') as f:
+            text = f.read()
+        with open(units_fname, 'w') as f:
+            f.write(text)
+        unitty.setup('test', units_fname=units_fname)
+        snapshot.save(self.fname)
+        os.remove(units_fname)
+        with self.assertRaisesRegex(ValueError, 'missing'):
+            snapshot.load(self.fname, 'test')
+        snapshot.load(self.fname, 'test', check=False)
+        
+    def test_version(self):
+        unitty.setup('test', units_raw=TEST_DICT_10, sys_raw=TEST_SYSTEMS_1)
+        snapshot.save(self.fname)
+        with np.load(self.fname) as data:
+            arrays = dict(data)
+        arrays['version'] = np.array(snapshot.VERSION + 1)
+        np.savez(self.fname, **arrays)
+        with self.assertRaises(ValueError):
+            snapshot.load(self.fname, 'test')
+            
+    def test_load_frozen(self):
+        unitty.setup('test', units_raw=TEST_DICT_10, sys_raw=TEST_SYSTEMS_1)
+        snapshot.save(self.fname)
+        snapshot.load(self.fname, 'test', freeze=True)
+        u = unitty.get_units('test')
+        self.assertTrue(u.frozen)
+        unitty.set_system('US')
+        val, unit_str = (7 << u.ft / u.lbs).in_sys()
+        self.assertAlmostEqual(val, 7)
+        self.assertEqual(unit_str, 'ft/lbs')
+        
+    def test_share(self):
+        unitty.setup('default')
+        a = unitty.get_units('default')
+        shm = snapshot.share('default')
+        try:
+            snapshot.attach(shm.name, 'shared')
+            self.assertEqual(unitty.get_active(), 'shared')
+            b = unitty.get_units('shared')
+            self.assertTrue(b.frozen)
+            self.assertEqual(a._num_dct, dict(b._num_dct))
+            self.assertEqual(len(a.units), len(b.units))
+            q = 1234.5 << b['kN/mm2']
+            self.assertEqual(tuple(q.in_sys()),
+                             tuple((1234.5 << a['kN/mm2']).in_sys()))
+            # The attached units use the shared memory, rather than a copy
+            values = b.units._arrays['values']
+            self.assertFalse(values.flags.writeable)
+            start = np.frombuffer(values.base, dtype=np.uint8).ctypes.data
+            shared = np.ndarray(values.shape, values.dtype, buffer=shm.buf,
+                                offset=values.ctypes.data - start)
+            shared[b.units._lazy['km']] = 5.0
+            self.assertEqual(b.km.value, 5.0)
+            del shared
+        finally:
+            shm.close()
+            shm.unlink()
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 12:04:51 2026
+
+@author: Reuben
+"""
+
+import unittest
+from unitty.spec import make_spec, mul_spec, div_spec, inv_spec, pow_spec
+
+
+class Test_Spec(unittest.TestCase):
+    def test_make_spec_signed(self):
+        spec = make_spec([4, 2, -6, -6])
+        self.assertEqual(spec, ((2, 1), (4, 1), (6, -2)))
+        
+    def test_make_spec_pairs(self):
+        spec = make_spec([(6, -2), (2, 1), (4, 1), (2, -1)])
+        self.assertEqual(spec, ((4, 1), (6, -2)))
+
+    def test_mul_spec(self):
+        a = make_spec([2, -6])
+        b = make_spec([6, 6, 4])
+        self.assertEqual(mul_spec(a, b), ((2, 1), (4, 1), (6, 1)))
+        self.assertEqual(mul_spec(a, ()), a)
+        
+    def test_div_spec(self):
+        a = make_spec([2, -6])
+        self.assertEqual(div_spec(a, a), ())
+        self.assertEqual(div_spec((), a), ((2, -1), (6, 1)))
+        
+    def test_inv_spec(self):
+        self.assertEqual(inv_spec(((2, 1), (6, -2))), ((2, -1), (6, 2)))
+        
+    def test_pow_spec(self):
+        a = make_spec([2, -6])
+        self.assertEqual(pow_spec(a, 3), ((2, 3), (6, -3)))
+        self.assertEqual(pow_spec(a, -2), ((2, -2), (6, 2)))
+        self.assertEqual(pow_spec(a, 0), ())
@@ -143,4 +143,182 @@ class Test_Systems(unittest.TestCase):
         unitty.set_system('US')
         val, spec = q.by_ref()
         self.assertEqual(val, 7 / (0.45359237 / (12*0.0254)))
-        self.assertEqual(spec, 'lbs.s2/ft')
\ No newline at end of file
+        self.assertEqual(spec, 'lbs.s2/ft')
+        
+    def test_unitise_typed_batch(self):
+        unitty.setup('test', units_raw=TEST_DICT_10, sys_raw=TEST_SYSTEMS_1)
+        s = unitty.get_systems('test')
+        u = unitty.get_units('test')
+        a = np.array([1.0, 2.5, 7.0])
+        groups = [(a, 'mm'), (a, u.ft), (a, u['kg.s2/m'].spec), (3.0, 'lbs')]
+        out = s.unitise_typed_batch(groups)
+        self.assertEqual([r[1] for r in out], ['mm', 'ft', 'kg.s2/m', 'lbs'])
+        for (val, unit), (res, unit_str) in zip(groups, out):
+            spec = getattr(u[unit_str], 'spec')
+            expected, _ = s.unitise_typed(val, spec)
+            np.testing.assert_allclose(res, expected)
+
+    def test_unitise_scalar_matches_trials(self):
+        unitty.setup('default')
+        np.random.seed(0)
+        for system in unitty.get_systems('default')._sys_dct.values():
+            for utype in system._sys_dct:
+                for n in (-2, 1, 3):
+                    breaks = system._decision_table(utype, n)[0]
+                    vals = list(10 ** np.random.uniform(-20, 20, 50))
+                    vals += [10 ** b for b in breaks]
+                    vals += [0.0, -3.0, np.nan, np.inf, 1e-320]
+                    for v in vals:
+                        with np.errstate(all='ignore'):
+                            expected = system._unitise_trials(v, utype, n)
+                            chosen = system._unitise_one(v, utype, n)
+                        self.assertEqual(chosen, expected)
+
+    def test_cached_unitise(self):
+        unitty.setup('test', units_raw=TEST_DICT_5, sys_raw=TEST_SYSTEMS_2)
+        s = unitty.get_systems('test')
+        u = unitty.get_units('test')
+        spec = (u.ft / u.lbs).spec
+        unitty.settings['cache_unitise'] = True
+        try:
+            results = [s.unitise(v, spec) for v in (2.0, 3.0, 4.0)]
+            info = s.cache_info()
+            self.assertEqual((info['hits'], info['misses']), (2, 1))
+            self.assertAlmostEqual(info['hit_rate'], 2 / 3)
+            s.set_active('US')
+            self.assertEqual(s.cache_info()['size'], 0)
+            cached = s.unitise(np.array([1.0, 2.0]), spec)
+        finally:
+            unitty.settings['cache_unitise'] = False
+        s.set_active('metric')
+        for v, (val, unit_str) in zip((2.0, 3.0, 4.0), results):
+            expected = s.unitise(v, spec)
+            self.assertAlmostEqual(val, expected[0])
+            self.assertEqual(unit_str, expected[1])
+        s.set_active('US')
+        expected = s.unitise(np.array([1.0, 2.0]), spec)
+        np.testing.assert_allclose(cached[0], expected[0])
+        self.assertEqual(cached[1], expected[1])
+
+    def test_cached_unitise_product(self):
+        unitty.setup('default')
+        u = unitty.get_units('default')
+        unitty.settings['cache_unitise'] = True
+        try:
+            # km.km formats as 'km2', which is also the unit km2 (1e3 m2)
+            miss = ((2000 << u.m) * (2000 << u.m)).in_sys()
+            hit = ((2500 << u.m) * (2000 << u.m)).in_sys()
+            info = unitty.get_systems('default').cache_info()
+        finally:
+            unitty.settings['cache_unitise'] = False
+        self.assertEqual(info['hits'], 1)
+        self.assertEqual(miss[1], 'km2')
+        self.assertAlmostEqual(miss[0], 4)
+        self.assertAlmostEqual(hit[0], 5)
+        self.assertEqual(hit[1], miss[1])
+
+    def test_unitise_elements(self):
+        unitty.setup('default')
+        s = unitty.get_systems('default')
+        u = unitty.get_units('default')
+        spec = (u.kN / u.mm2).spec
+        np.random.seed(1)
+        a = 10 ** np.random.uniform(-12, 12, 200)
+        a = np.concatenate((a, [0.0, np.nan, np.inf, -5.0]))
+        with np.errstate(all='raise'):
+            vals, codes, labels = s.unitise_elements(a, spec)
+        self.assertEqual(codes.dtype, np.uint8)
+        self.assertGreater(len(labels), 1)
+        for v, val, code in zip(a, vals, codes):
+            with np.errstate(all='ignore'):
+                expected, unit_str = s.unitise(float(v), spec)
+            np.testing.assert_equal(val, expected)
+            self.assertEqual(labels[code], unit_str)
+
+    def test_unitise_order(self):
+        unitty.setup('default')
+        s = unitty.get_systems('default')
+        u = unitty.get_units('default')
+        cases = [('metric', 4200, 'N.m', 4.2, 'kN.m'),
+                 ('metric', 4200, 'J/kg', 4.2, 'kJ/kg'),
+                 ('metric', 5, 'N/mm', 5, 'kN/m'),
+                 ('metric', 0.001, 'kg.m2', 1, 'g.m2'),
+                 ('metric', 4200, 'kg.m/s2', 4.2, 'm.tonne/s2'),
+                 ('metric', 0.02, 'kg.m/s2', 20, 'g.m/s2'),
+                 ('metric', 7e6, 'm/s2', 7, 'km/(ms.s)'),
+                 ('metric', 0.012, 'm.m', 12, 'm.mm'),
+                 ('US', 0.0003, 'kg.m/s2', 34.71846648580748, 'ft.oz/s2')]
+        for sys_name, val, unit_str, expected_val, expected in cases:
+            s.set_active(sys_name)
+            q = val << u[unit_str]
+            out_val, out_str = q.in_sys()
+            self.assertEqual(out_str, expected)
+            self.assertAlmostEqual(out_val, expected_val)
+            vals, codes, labels = s.unitise_elements([q.value], q.spec)
+            self.assertEqual(labels[codes[0]], expected)
+            self.assertAlmostEqual(vals[0], expected_val)
+        s.set_active('metric')
+
+    def test_unitise_elements_shape(self):
+        unitty.setup('default')
+        s = unitty.get_systems('default')
+        u = unitty.get_units('default')
+        vals, codes, labels = s.unitise_elements([[0.001, 2000.0]],
+                                                 u.m.spec)
+        self.assertEqual(vals.shape, (1, 2))
+        self.assertEqual([labels[c] for c in codes[0]], ['mm', 'km'])
+
+    def test_by_refs(self):
+        unitty.setup('test', units_raw=TEST_DICT_10, sys_raw=TEST_SYSTEMS_1)
+        s = unitty.get_systems('test')
+        s.set_refs(os.path.join(root, 'ref_set_1.csv'))
+        self.assertEqual(s._ref_table['US']['complex.value'][1], 'lbs.s2/ft')
+        a = np.array([1.0, 7.0])
+        out = s.by_refs({'complex.value': a, 'unknown': a})
+        self.assertIsNone(out['unknown'])
+        val, unit_str = out['complex.value']
+        np.testing.assert_allclose(val, a)
+        self.assertEqual(unit_str, 'kg.s2/m')
+        unitty.set_system('US')
+        val, unit_str = s.by_refs({'complex.value': a})['complex.value']
+        np.testing.assert_allclose(val, a / (0.45359237 / (12*0.0254)))
+        self.assertEqual(unit_str, 'lbs.s2/ft')
+
+    def test_using_system(self):
+        unitty.setup('test', units_raw=TEST_DICT_5, sys_raw=TEST_SYSTEMS_1)
+        u = unitty.get_units('test')
+        q = 7 << u.ft / u.lbs
+        with unitty.using_system('US') as system:
+            self.assertIs(system, unitty.get_system())
+            self.assertEqual(q.in_sys()[1], 'ft/lbs')
+            unitty.set_system('metric')
+            self.assertEqual(q.in_sys()[1], 'ft/lbs')
+        self.assertEqual(q.in_sys()[1], 'm/kg')
+        with self.assertRaises(KeyError):
+            with unitty.using_system('other'):
+                pass
+
+    def test_using_system_threads(self):
+        from concurrent.futures import ThreadPoolExecutor
+        unitty.setup('test', units_raw=TEST_DICT_5, sys_raw=TEST_SYSTEMS_1)
+        u = unitty.get_units('test')
+        q = 7 << u.ft / u.lbs
+        
+        def render(name):
+            with unitty.using_system(name):
+                return [q.in_sys()[1] for k in range(200)]
+        
+        names = ['metric', 'US'] * 8
+        with ThreadPoolExecutor(8) as executor:
+            results = list(executor.map(render, names))
+        expected = {'metric': 'm/kg', 'US': 'ft/lbs'}
+        for name, units in zip(names, results):
+            self.assertEqual(set(units), {expected[name]})
+
+    def test_using_group(self):
+        unitty.setup('test_2', units_raw=TEST_DICT_10, sys_raw=TEST_SYSTEMS_1)
+        unitty.setup('test', units_raw=TEST_DICT_5, sys_raw=TEST_SYSTEMS_1)
+        with unitty.using_group('test_2'):
+            self.assertEqual(unitty.get_active(), 'test_2')
+            self.assertIn('mm', unitty.get_units().units)
+        self.assertEqual(unitty.get_active(), 'test')
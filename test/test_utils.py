@@ -9,6 +9,8 @@ import unittest
 import unitty
 from unitty import utils
 import numpy as np
+import os
+import tempfile
 
 PD_PRESENT = False
 try:
@@ -110,10 +112,184 @@ class Test_Units(unittest.TestCase):
         df2 = utils.transform_df(df)
         v1 = 11.0*(1/0.45359237)
         v2 = 17.0*(1/0.45359237)
-        out = df2.to_dict(orient='rows')
+        out = df2.to_dict(orient='records')
         expected = [{'abcd [kg.mm/s]': 5.7, 'efgh [mm2/kg]': v1},
                 {'abcd [kg.mm/s]': 9, 'efgh [mm2/kg]': v2}]
         for out_row, expected_row in zip(out, expected):
             for k, v in out_row.items():
                 self.assertTrue(k in expected_row)
                 self.assertAlmostEqual(v, expected_row[k])
+
+    def test_transform_csv(self):
+        rows = [['name', 'abcd [m.kg/s]', 'efgh [mm2/lbs]'],
+                ['a', '0.0057', '11.0'],
+                ['b', '0.009', '17.0'],
+                ['c', '0.004', ''],
+                ['d', '0.002', 'n/a']]
+        with tempfile.TemporaryDirectory() as tmp:
+            fname = os.path.join(tmp, 'in.csv')
+            out_fname = os.path.join(tmp, 'out.csv')
+            with open(fname, 'w', newline='') as f:
+                f.write('\n'.join(','.join(row) for row in rows))
+            utils.transform_csv(fname, out_fname, chunksize=2)
+            with open(out_fname, 'r', newline='') as f:
+                out = [line.split(',') for line in f.read().splitlines()]
+        self.assertEqual(out[0], ['name', 'abcd [kg.mm/s]', 'efgh [mm2/kg]'])
+        self.assertEqual([row[0] for row in out[1:]], ['a', 'b', 'c', 'd'])
+        expected = [5.7, 9, 4, 2]
+        for row, v in zip(out[1:], expected):
+            self.assertAlmostEqual(float(row[1]), v)
+        self.assertAlmostEqual(float(out[2][2]), 17.0 / 0.45359237)
+        self.assertEqual(out[3][2], '')
+        self.assertEqual(out[4][2], 'n/a')
+
+    def test_transform_csv_ragged(self):
+        rows = [['name', 'abcd [m.kg/s]', 'efgh [mm2/lbs]'],
+                ['a', '0.0057', '11.0'],
+                ['b', '0.009', '17.0'],
+                ['c'],
+                [''], # A blank line in the second chunk
+                ['d', '0.002'],
+                ['e', '0.003', '5.0', 'extra']]
+        with tempfile.TemporaryDirectory() as tmp:
+            fname = os.path.join(tmp, 'in.csv')
+            out_fname = os.path.join(tmp, 'out.csv')
+            with open(fname, 'w', newline='') as f:
+                f.write('\n'.join(','.join(row) for row in rows))
+            utils.transform_csv(fname, out_fname, chunksize=2)
+            with open(out_fname, 'r', newline='') as f:
+                out = [line.split(',') for line in f.read().splitlines()]
+        self.assertEqual(out[0], ['name', 'abcd [kg.mm/s]', 'efgh [mm2/kg]'])
+        self.assertAlmostEqual(float(out[2][1]), 9)
+        self.assertAlmostEqual(float(out[2][2]), 17.0 / 0.45359237)
+        self.assertEqual(out[3], ['c'])
+        self.assertEqual(out[4], [''])
+        self.assertEqual(len(out[5]), 2)
+        self.assertAlmostEqual(float(out[5][1]), 2)
+        self.assertEqual(len(out[6]), 4)
+        self.assertEqual(out[6][3], 'extra')
+
+    def test_transform_csv_repeated_factor(self):
+        unitty.setup('default')
+        with tempfile.TemporaryDirectory() as tmp:
+            fname = os.path.join(tmp, 'in.csv')
+            out_fname = os.path.join(tmp, 'out.csv')
+            with open(fname, 'w', newline='') as f:
+                f.write('x [m.m]\n4e6\n5e6\n')
+            utils.transform_csv(fname, out_fname)
+            with open(out_fname, 'r', newline='') as f:
+                out = f.read().splitlines()
+        self.assertEqual(out[0], 'x [km2]') # Not the unit km2 (1e3 m2)
+        self.assertAlmostEqual(float(out[1]), 4)
+        self.assertAlmostEqual(float(out[2]), 5)
+
+    def test_transform_df_inplace(self):
+        if not PD_PRESENT:
+            return
+        df = pd.DataFrame({'name': ['a', 'b'],
+                           'abcd [m.kg/s]': [0.0057, 0.009],
+                           'efgh [mm2/kg]': [11.0, 17.0],
+                           'ijkl [m]': [2, 3]})
+        df_copy = utils.transform_df(df)
+        self.assertEqual(list(df.columns)[1], 'abcd [m.kg/s]')
+        df2 = utils.transform_df(df, copy=False)
+        self.assertIs(df2, df)
+        self.assertEqual(list(df.columns),
+                         ['name', 'abcd [kg.mm/s]', 'efgh [mm2/kg]', 'ijkl [m]'])
+        self.assertEqual(list(df['name']), ['a', 'b'])
+        np.testing.assert_allclose(df['abcd [kg.mm/s]'], [5.7, 9.0])
+        np.testing.assert_allclose(df['efgh [mm2/kg]'], [11.0, 17.0])
+        np.testing.assert_allclose(df['ijkl [m]'], [2, 3])
+        self.assertEqual(df.to_dict(), df_copy.to_dict())
+
+    def test_transform_df_repeated_factor(self):
+        if not PD_PRESENT:
+            return
+        unitty.setup('default')
+        for copy in (True, False):
+            df = pd.DataFrame({'x [m.m]': [4e6, 5e6]})
+            df2 = utils.transform_df(df, copy=copy)
+            self.assertEqual(list(df2.columns), ['x [km2]'])
+            np.testing.assert_allclose(df2['x [km2]'], [4, 5])
+
+    def test_convert_array(self):
+        a = np.linspace(0, 1, 25).reshape(5, 5)
+        with tempfile.TemporaryDirectory() as tmp:
+            fname = os.path.join(tmp, 'in.npy')
+            out_fname = os.path.join(tmp, 'out.npy')
+            np.save(fname, a)
+            out, unit_str = utils.convert_array(fname, 'mm', out=out_fname,
+                                                chunksize=2)
+            self.assertEqual(unit_str, 'mm')
+            self.assertIsInstance(out, np.memmap)
+            del out
+            np.testing.assert_allclose(np.load(out_fname), a * 1000)
+        out, unit_str = utils.convert_array(a, 'kg.mm/s')
+        self.assertEqual(unit_str, 'kg.mm/s')
+        np.testing.assert_allclose(out, a * 1000)
+
+    def test_transform_list_of_dicts_processes(self):
+        lst = [{'abcd [m.kg/s]': 0.0057 * (i + 1), 'efgh [mm2/lbs]': 11.0,
+                'name': 'x', 'ijkl [mm]': 'text'} for i in range(50)]
+        expected = [utils.transform_dict(dct) for dct in lst]
+        self.assertListEqual(utils.transform_list_of_dicts(lst), expected)
+        out = utils.transform_list_of_dicts(lst, processes=2)
+        self.assertListEqual(out, expected)
+
+    def test_transform_plan(self):
+        lst = [{'abcd [m.kg/s]': 0.0057, 'efgh [mm2/lbs]': 11.0, 'name': 'x'},
+               {'abcd [m.kg/s]': 0.009, 'efgh [mm2/lbs]': 17.0, 'name': 'y'}]
+        plan = utils.TransformPlan(lst[0])
+        self.assertEqual(plan['abcd [m.kg/s]'][0], 'abcd [kg.mm/s]')
+        self.assertEqual(plan['name'], ('name', None))
+        expected = utils.transform_list_of_dicts(lst)
+        out = plan.apply_list(lst)
+        for out_row, expected_row in zip(out, expected):
+            self.assertEqual(list(out_row), list(expected_row))
+            for k, v in out_row.items():
+                if k != 'name':
+                    self.assertAlmostEqual(v, expected_row[k])
+        a = plan.apply({'abcd [m.kg/s]': np.array([0.001, 0.002])})
+        np.testing.assert_allclose(a['abcd [kg.mm/s]'], [1, 2])
+        self.assertEqual(plan.apply({'ijkl [m]': 0.002}), {'ijkl [mm]': 2})
+
+    def test_transform_plan_repeated_factor(self):
+        unitty.setup('default')
+        # km.km formats as 'km2', which is also the unit km2 (1e3 m2)
+        self.assertEqual(utils.transform_pair('x [m.m]', 4e6),
+                         ('x [km2]', 4.0))
+        plan = utils.TransformPlan({'x [m.m]': 4e6})
+        out = plan.apply({'x [m.m]': 5e6})
+        self.assertEqual(list(out), ['x [km2]'])
+        self.assertAlmostEqual(out['x [km2]'], 5.0)
+        
+    def test_transform_plan_refs(self):
+        unitty.get_systems('test').set_refs(
+            {'widget_length': {'metric': 'mm'}})
+        plan = utils.TransformPlan({'widget_length [m]': 2.0})
+        self.assertEqual(plan.apply({'widget_length [m]': 3.0}),
+                         {'widget_length [mm]': 3000.0})
+        
+    def test_transform_plan_not_numbers(self):
+        lst = [{'len [m]': 0.002, 'name': 'x'},
+               {'len [m]': None, 'name': 'y'},
+               {'len [m]': 'n/a', 'name': 'z'}]
+        plan = utils.TransformPlan(lst[0])
+        out = plan.apply_list(lst)
+        self.assertEqual(out, [utils.transform_dict(dct) for dct in lst])
+        self.assertEqual(out[1], {'len [m]': None, 'name': 'y'})
+
+    def test_transform_plan_stale(self):
+        sys_raw = {'metric': TEST_SYSTEMS_20['metric'],
+                   'US': {'length': ['in'], 'mass': ['lbs'], 'time': ['s']}}
+        unitty.setup('test', units_raw=TEST_DICT_30, sys_raw=sys_raw)
+        plan = utils.TransformPlan(['abcd [m]'])
+        self.assertFalse(plan.stale)
+        self.assertEqual(plan['abcd [m]'], ('abcd [m]', None))
+        unitty.set_system('US')
+        self.assertTrue(plan.stale)
+        plan.build()
+        self.assertFalse(plan.stale)
+        self.assertEqual(plan['abcd [m]'][0], 'abcd [in]')
+        self.assertAlmostEqual(plan.apply({'abcd [m]': 0.0254})['abcd [in]'],
+                               1.0)
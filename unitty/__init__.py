@@ -17,11 +17,11 @@ Each Quantity contains:
     
 * **value:** A float representing the magnitude of the quantity in terms of 
   base dimensions (length, time, mass, etc)
-* **spec:** A list of signed integers. For simple units, there will be only one
-  integer. For compound units (e.g. m/s), there will be more than one.
-  The integers correspond to other Quantities. Positive 
-  integers indicate the are multiplied, while negative integers indicate 
-  they are divided.
+* **spec:** A tuple of (index, exponent) pairs. For simple units, there will
+  be only one pair. For compound units (e.g. m/s), there will be more than
+  one. The indices correspond to other Quantities, and the exponents are
+  the powers they are raised to. Negative exponents indicate they are
+  divided.
 * **vector:** Each base dimensions is independent, and the exponent for each
   base dimension is represented as a number. This vectore is an array
   of such numbers for all base dimensions. This allows quick and robust
@@ -80,17 +80,26 @@ namespace module.
 """
 
 settings = {
-        'always_make_quantities': False
+        'always_make_quantities': False,
+        'cache_unitise': False
         }
 
 from . import namespace
 from .namespace import get_units, get_systems, get_system, get_active, \
-    set_system, setup
+    set_system, setup, using_group, using_system, freeze
 from . import base
 from . import system
 from . import quantity
 from . import unit
-from . import utils
+
+_LAZY = ('utils', 'snapshot') # Submodules imported on first use
+
+def __getattr__(name):
+    if name in _LAZY:
+        import importlib
+        return importlib.import_module('.' + name, __name__)
+    raise AttributeError('module ' + repr(__name__) + ' has no attribute '
+                         + repr(name))
 
 # Inject dependencies
 namespace._inject(base.Units, system.Systems)
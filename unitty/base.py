@@ -69,13 +69,170 @@ Each unit is defined by a list. The abbreviation is used as a key for the list.
 """
 
 import os
-import ruamel.yaml as yaml
+import re
+import types
 import numpy as np
 
 from .unit import Unit
+from .namespace import get_active
+from .cache import LRUCache
+from .dimension import Dimensions
+from .spec import make_spec, inv_spec
 
 root = os.path.dirname(os.path.abspath(__file__))
 
+# Unit strings have a numerator and optional denominator, either of which
+# may be wrapped in brackets: e.g. 'kg.m/(s2.K)'
+_UNIT_STR = re.compile(r'\s*(\()?([^/()\-^]*)(\))?\s*'
+                       r'(?:/\s*(\()?([^/()\-^]*)(\))?\s*)?')
+_ITEM = re.compile(r'[^\s.]+') # Factors are separated by '.' or spaces
+_EXPONENT = re.compile(r'\d+$')
+_SEP_SPACES = re.compile(r'\s*([./()])\s*')
+_SPACES = re.compile(r'\s+')
+
+
+def load_yaml(fname):
+    """ Return the contents of a yaml file 
+    
+    Args:
+        fname (str): The filename.
+        
+    Returns:
+        The data in the file, as plain dicts, lists, strings and numbers.
+    
+    Note:
+        The yaml package is imported the first time a file is read, rather
+        than when unitty is imported.
+    """
+    from ruamel.yaml import YAML
+    with open(fname, 'r') as f:
+        return YAML(typ='safe').load(f)
+
+
+class UnitDict(dict):
+    """ A dictionary of Unit instances that creates some on first access 
+    
+    Units added with :meth:`add_lazy` are held as plain records until they 
+    are first looked up, at which point their Unit instance is created and
+    kept. They are included in `in`, `len` and iteration as usual.
+    
+    """
+    def __init__(self):
+        super().__init__()
+        self._lazy = {}
+        
+    def __missing__(self, abbr):
+        rec = self._lazy.get(abbr)
+        if rec is None:
+            # Another thread may have created it since the lookup missed
+            u = dict.get(self, abbr)
+            if u is None:
+                raise KeyError(abbr)
+            return u
+        value, spec, vector, name, parent = rec
+        u = Unit(value=value, spec=spec, vector=vector, abbr=abbr, name=name,
+                 parent=parent)
+        # Another thread may have created it in the meantime
+        u = dict.setdefault(self, abbr, u)
+        self._lazy.pop(abbr, None)
+        return u
+    
+    def __contains__(self, abbr):
+        # Units are added to the dict before they are removed from _lazy
+        return abbr in self._lazy or dict.__contains__(self, abbr)
+    
+    def __len__(self):
+        return dict.__len__(self) + len(self._lazy)
+    
+    def __iter__(self):
+        return iter(list(dict.keys(self)) + list(self._lazy))
+    
+    def add_lazy(self, abbr, value, spec, vector, name, parent):
+        """ Add a unit that is only created when it is first needed """
+        self._lazy[abbr] = (value, spec, vector, name, parent)
+    
+    def keys(self):
+        return list(self)
+    
+    def values(self):
+        return [self[abbr] for abbr in self]
+    
+    def items(self):
+        return [(abbr, self[abbr]) for abbr in self]
+    
+    def get(self, abbr, default=None):
+        try:
+            return self[abbr]
+        except KeyError:
+            return default
+    
+    def records(self):
+        """ Return (abbr, value, spec, vector, name) for every unit 
+        
+        This does not create any Unit instances.
+        """
+        out = [(abbr, u.value, u.spec, u.vector, u.name) 
+               for abbr, u in dict.items(self)]
+        out += [(abbr,) + rec[:4] for abbr, rec in self._lazy.items()]
+        return out
+
+
+class FrozenUnitDict(UnitDict):
+    """ A UnitDict whose units are rows of contiguous arrays
+    
+    Args:
+        units (Units): The Units instance, which must contain the strings
+            for every unit.
+        arrays (dict): The arrays from :meth:`Units.to_arrays`.
+        parent (str): The name of the group the units belong to.
+    
+    Each unit is only a row number until it is first looked up. No units 
+    can be added. See :meth:`Units.freeze`.
+    
+    """
+    def __init__(self, units, arrays, parent):
+        super().__init__()
+        self._arrays = arrays
+        self._vectors = units.dims.adopt(arrays['dims'])
+        self._starts = [0] + np.cumsum(arrays['spec_lens']).tolist()
+        self._parent = parent
+        self._lazy = {units.str(index): row for row, index 
+                      in enumerate(arrays['indices'].tolist())}
+        
+    def __missing__(self, abbr):
+        row = self._lazy.get(abbr)
+        if row is None:
+            # Another thread may have created it since the lookup missed
+            u = dict.get(self, abbr)
+            if u is None:
+                raise KeyError(abbr)
+            return u
+        value, spec, vector, name = self._record(row)
+        u = Unit(value=value, spec=spec, vector=vector, abbr=abbr, name=name,
+                 parent=self._parent)
+        u = dict.setdefault(self, abbr, u)
+        self._lazy.pop(abbr, None)
+        return u
+    
+    def __setitem__(self, abbr, u):
+        raise TypeError('Cannot add ' + abbr + ': the units are frozen.')
+    
+    def add_lazy(self, abbr, value, spec, vector, name, parent):
+        raise TypeError('Cannot add ' + abbr + ': the units are frozen.')
+    
+    def _record(self, row):
+        """ Return (value, spec, vector, name) for a row """
+        a = self._arrays
+        specs = a['specs'][self._starts[row]:self._starts[row + 1]]
+        return (float(a['values'][row]), tuple(map(tuple, specs.tolist())),
+                self._vectors[a['dim_rows'][row]], str(a['names'][row]))
+    
+    def records(self):
+        out = [(abbr, u.value, u.spec, u.vector, u.name) 
+               for abbr, u in dict.items(self)]
+        out += [(abbr,) + self._record(row) 
+                for abbr, row in self._lazy.items()]
+        return out
 
 
 class Units():
@@ -103,18 +260,156 @@ class Units():
     
     It's the job of the Units class to load in the
     specified units and set up the units, vectors, and indices for them.
+    
+    Compound units derived from strings (e.g. 'kg/(s2.m)') are not
+    added to the units and indices. Instead, they are held in a
+    size-bounded, least-recently-used cache (see :attr:`cache`), so that
+    applications that see many different unit strings do not grow without
+    limit. The units loaded from the specification are never evicted.
+    
+    SI-prefixed units and inverse units are only created when they are first
+    used (see :class:`UnitDict`), since most of them never are.
+    
+    A Units instance can be frozen (see :meth:`freeze`), after which its 
+    units are stored in a few contiguous arrays and no more units or strings
+    can be added. That suits processes that are forked from a parent that
+    has already set up the units.
                 
     """
-    def __init__(self, fname=None, raw=None):
+    def __init__(self, fname=None, raw=None, cache_size=1024):
+        self._make_caches(cache_size)
         if fname is None and raw is None:
             fname = os.path.join(root, 'units') + '.yaml'
+        self.fname = fname if raw is None else None
         raw = self._load_raw(fname) if raw is None else raw
         self.load(raw)
+
+    def _make_caches(self, cache_size):
+        self.cache = LRUCache(cache_size)
+        self._spellings = LRUCache(cache_size)
+        self._pairs = LRUCache(cache_size)
+        self._spec_strs = LRUCache(cache_size)
+
+    @classmethod
+    def from_arrays(cls, arrays, raw=None, fname=None, cache_size=1024,
+                    freeze=False):
+        """ Create a Units instance from the output of :meth:`to_arrays`
+        
+        Args:
+            arrays (dict): The arrays.
+            raw (dict): [Optional] The raw data the units were loaded from.
+            fname (str): [Optional] The file the units were loaded from.
+            cache_size (int): [Optional] The size of the cache.
+            freeze (bool): [Optional] If True, the units are frozen, and
+                use the arrays directly rather than copying them (see 
+                :meth:`freeze`).
+            
+        Returns:
+            Units: A Units instance, identical to the one that created the
+            arrays.
+        """
+        self = cls.__new__(cls)
+        self._make_caches(cache_size)
+        self.fname = fname
+        self.raw = raw
+        self._clear()
+        self.utypes = arrays['utypes'].tolist()
+        for s in arrays['strings'].tolist():
+            self._ind(s)
+        indices = arrays['indices'].tolist()
+        self._utypes.update(zip(indices, arrays['utype_indices'].tolist()))
+        self.bases = dict(arrays['bases'].tolist())
+        if freeze:
+            self._freeze(arrays)
+            return self
+        starts = np.cumsum(arrays['spec_lens']).tolist()
+        specs = arrays['specs'].tolist()
+        vectors = self.dims.adopt(arrays['dims'])
+        records = zip(indices, arrays['values'].tolist(),
+                      arrays['dim_rows'].tolist(), arrays['names'].tolist(),
+                      [0] + starts, starts)
+        parent = get_active()
+        for index, value, row, name, a, b in records:
+            self.units.add_lazy(self.str(index), value,
+                                tuple(map(tuple, specs[a:b])), vectors[row],
+                                name, parent)
+        return self
+    
+    def to_arrays(self):
+        """ Return the units as a dictionary of arrays 
+        
+        Returns:
+            dict: A dictionary of numpy arrays, none of which contain
+            Python objects, from which :meth:`from_arrays` can recreate the
+            units. For frozen units, these are the arrays that hold the 
+            units.
+        """
+        if self.frozen:
+            return dict(self._arrays)
+        n = len(self._num_dct) // 2
+        abbrs, values, specs, vectors, names = zip(*self.units.records())
+        indices = [self._ind_dct[abbr] for abbr in abbrs]
+        dims, rows = np.unique(np.array(vectors, dtype=float), axis=0,
+                               return_inverse=True)
+        return {'utypes': np.array(self.utypes, dtype=str),
+                'strings': np.array([self.str(i) for i in range(1, n + 1)],
+                                    dtype=str),
+                'indices': np.array(indices, dtype=np.int64),
+                'values': np.array(values, dtype=float),
+                'dims': dims,
+                'dim_rows': rows.reshape(-1).astype(np.int64),
+                'utype_indices': np.array([self._utypes[i] for i in indices],
+                                          dtype=np.int64),
+                'names': np.array(names, dtype=str),
+                'spec_lens': np.array([len(spec) for spec in specs],
+                                      dtype=np.int64),
+                'specs': np.array([pair for spec in specs for pair in spec],
+                                  dtype=np.int64).reshape(-1, 2),
+                'bases': np.array(list(self.bases.items()),
+                                  dtype=np.int64).reshape(-1, 2)}
+    
+    def freeze(self):
+        """ Make the units immutable, and store them in contiguous arrays
+        
+        The value, spec, name and dimension vector of every unit are moved
+        into a few numpy arrays (see :meth:`to_arrays`), and each Unit 
+        instance is only created from them when it is first used. The 
+        mappings between strings and indices become read-only, so no more
+        units can be added, and unit strings can only be parsed into 
+        (cached) derived units.
+        
+        This is intended for processes that are forked after the units are
+        set up, so that the units are shared rather than copied into each 
+        one. Any Systems must be created before the units are frozen. Unit
+        instances used before freezing remain valid, but are not the ones
+        returned afterwards.
+        
+        Returns:
+            Units: This instance.
+        """
+        if not self.frozen:
+            self._freeze(self.to_arrays())
+        return self
+    
+    def _freeze(self, arrays):
+        self.dims = Dimensions() # Frees the old vectors and their lookups
+        self.cache.clear()
+        self._factors = {}
+        self.units = FrozenUnitDict(self, arrays, get_active())
+        self.utypes = tuple(self.utypes)
+        self.bases = types.MappingProxyType(self.bases)
+        self._utypes = types.MappingProxyType(self._utypes)
+        self._num_dct = types.MappingProxyType(self._num_dct)
+        self._ind_dct = types.MappingProxyType(self._ind_dct)
+        self._arrays = arrays
+        self.frozen = True
     
     def _ind(self, s):
         """ Get the index of a string """
         if s in self._ind_dct:
             return self._ind_dct[s]
+        if self.frozen:
+            raise TypeError('Cannot add ' + s + ': the units are frozen.')
         index = len(self._num_dct) // 2 + 1
         self._num_dct[index] = s
         self._ind_dct[s] = index
@@ -126,27 +421,37 @@ class Units():
         """ Return the string for an index number """
         return self._num_dct[ind]
             
-    def _new(self, index, value, vector, spec, name, utype):
+    def _new(self, index, value, vector, spec, name, utype, lazy=False):
         """ Internal creation of one unit """
         abbr = self.str(index)
         if abbr in self.units:
             raise KeyError(abbr + ' is already defined.')
         self._utypes[index] = utype
+        vector = self.dims.intern(vector)
+        self._factors.pop(self.dims.key(vector), None)
+        if lazy:
+            parent = get_active()
+            self.units.add_lazy(abbr, value, spec, vector, name, parent)
+            return None
         u = Unit(value=value, spec=spec, vector=vector, abbr=abbr, name=name)
         self.safe_set(self.units, abbr, u)
         return u
     
-    def new(self, index, value, vector, spec, name, utype):
+    def new(self, index, value, vector, spec, name, utype, lazy=False):
         """ Create a new unit 
         
+        If lazy is True, the Unit instance is only created when it is first
+        used, and None is returned. The inverse unit is always lazy.
+        
         TODO: Use of the index here is unnecessary. Could replace with 
         the abbreviation.
         
         """ 
-        u = self._new(index, value, vector, spec, name, utype)
+        u = self._new(index, value, vector, spec, name, utype, lazy)
         # Now make the corresponding inverse ('negative') unit
-        spec = [-s for s in spec]
-        self._new(-index, 1/value, -vector, spec, name, -utype)
+        spec = inv_spec(spec)
+        vector = self.dims.inv(self.dims.intern(vector))
+        self._new(-index, 1/value, vector, spec, name, -utype, lazy=True)
         return u
     
     def _make_utypes(self, types):
@@ -164,23 +469,30 @@ class Units():
             return a
         for i, t in enumerate(types):
             index = self._ind(t)
-            self.new(index, 1.0, vec(i), [index], t, index)
+            self.new(index, 1.0, vec(i), ((index, 1),), t, index)
     
     def _clear(self):
-        self.units = {} # The unit instances
+        self.units = UnitDict() # The unit instances
         self.bases = {} # The base units for time, length, etc
         self._utypes = {} # the length, time etc for given id
         self._num_dct = {} # The attr for given index
         self._ind_dct = {} # the index for given attr
+        self.dims = Dimensions() # The shared dimension vectors
+        self.cache.clear() # Derived units
+        self._spellings.clear() # Specs for unit strings
+        self._factors = {} # Conversion factor tables for each dimension
+        self._pairs.clear() # Conversion factors for pairs of unit strings
+        self._spec_strs.clear() # Unit strings for specs
+        self._arrays = None # The arrays that hold frozen units
+        self.frozen = False
         
     def load(self, dct):
         self._clear()
         self._make_type_dct(dct)
+        self.raw = dct # Kept so that the units can be recreated
     
     def _load_raw(self, fname):
-        with open(fname, 'r') as f:
-            raw = yaml.safe_load(f)
-        return raw
+        return load_yaml(fname)
     
     def safe_set(self, unit_dct, key, val):
         if key in unit_dct:
@@ -203,7 +515,7 @@ class Units():
         if not isinstance(derivation, list):
             derivation = [derivation]
         m, vector = self._derive(derivation)
-        spec = [index]
+        spec = ((index, 1),)
         val = value * m
         self.new(index, val, vector, spec, name, utype)
         if dct is not None and 'SI_prefixes' in dct:
@@ -226,7 +538,8 @@ class Units():
             prefixed_name = n + name
             i = self._ind(prefixed)
             v = val * m
-            self.new(i, v, vector, spec, prefixed_name, utype)
+            self.new(i, v, vector, ((i, 1),), prefixed_name, utype,
+                     lazy=True)
     
     def _make_type_dct(self, dct):
         units = self.units
@@ -256,9 +569,10 @@ class Units():
             u = self.from_str(abbr[0])
             u.set_ref(abbr[1])
             return u
-        if abbr in self.units:
+        try:
             return self.units[abbr]
-        return self.from_str(abbr)
+        except KeyError:
+            return self.from_str(abbr)
 
     def __getattr__(self, abbr):
         if abbr not in ['units', 'bases'] and abbr in self.units:
@@ -270,24 +584,39 @@ class Units():
         return self.units[self._num_dct[i]]
     
     def str_spec(self, spec):
+        """ Return the unit string for a spec 
+        
+        Args:
+            spec (tuple): A tuple of (index, exponent) pairs.
+            
+        Returns:
+            str: The unit string, with multiplied and divided units each
+            sorted by abbreviation (e.g. 'kg.m/s2').
+            
+        Note:
+            Strings are cached by spec, since the same few specs tend to 
+            be formatted over and over again.
+        """
         if spec is None:
             return 'base'
-        elif len(spec)==0:
+        s = self._spec_strs.get(spec)
+        if s is None:
+            s = self._str_spec(spec)
+            self._spec_strs.put(spec, s)
+        return s
+
+    def _str_spec(self, spec):
+        if len(spec)==0:
             return 'dimensionless'
-        num = [i for i in spec if i > 0]
-        den = [-i for i in spec if i < 0]
         def f(v, c):
             if c == 1:
                 return v
             else:
                 return v + str(c)
-        def process(lst):
-            out = [self._num_dct[i] for i in lst]    
-            out.sort()
-            d = {v: out.count(v) for v in out}
-            return [f(v, c) for v, c in d.items()]
-        num = process(num)
-        den = process(den)
+        num = sorted([(self._num_dct[i], n) for i, n in spec if n > 0])
+        den = sorted([(self._num_dct[i], -n) for i, n in spec if n < 0])
+        num = [f(v, c) for v, c in num]
+        den = [f(v, c) for v, c in den]
         s_num = '1' if len(num) == 0 else '.'.join(num)
         n = len(den)
         if n == 0:
@@ -297,9 +626,20 @@ class Units():
         else:
             return s_num + '/(' + '.'.join(den) + ')'
 
-    def spec_from_str(self, s, sep=','):
-        if s is None or s in ['', 'dimensionless']:
-            return []
+    def canonical(self, s):
+        """ Return the canonical form of a unit string 
+        
+        Args:
+            s (str): A unit string (e.g. 'kg m/(s.s)').
+            
+        Returns:
+            str: The unit string with its factors sorted and exponents
+            collapsed (e.g. 'kg.m/s2').
+        """
+        return self.str_spec(self.spec_from_str(s))
+
+    def _str_error(self, s):
+        """ Raise a ValueError that describes what is wrong with a string """
         slash_count = s.count('/')
         open_bracket_count = s.count('(')
         close_bracket_count = s.count(')')
@@ -319,52 +659,190 @@ class Units():
         if slash_count > 1:
             raise ValueError('Unit string "' + str(s) + '" is invalid. They ' +
                              'can have at most one divide symbol.')
-        elif slash_count == 1:
-            num, den = s.split('/')
-            num = num.strip(' ()')
-            den = den.strip(' ()')
-        else:
-            num = s.strip(' ()')
-            den = ''
-        if num in ['1', '1.0']:
-            num = ''
+        raise ValueError('Unit string "' + str(s) + '" is invalid.')
+
+    def _parse_item(self, item):
+        """ Return the index and exponent for one factor (e.g. 'm10') """
+        ind = self._ind_dct.get(item)
+        if ind is not None:
+            return ind, 1
+        m = _EXPONENT.search(item)
+        if m is not None:
+            # Prefer the longest unit abbreviation, so 'in23' is in2 cubed
+            for k in range(1, len(m.group()) + 1):
+                ind = self._ind_dct.get(item[:-k])
+                if ind is not None:
+                    return ind, int(item[-k:])
+            item = item[:-1]
+        raise ValueError('Unit "' + str(item) + '" not recognised.')
+
+    def spec_from_str(self, s, sep=','):
+        """ Parse a unit string into a spec 
+        
+        Args:
+            s (str): A unit string (e.g. 'kg/(s2.m)').
             
-        def process(st):
-            if len(st) == 0:
-                return []
-            out = []
-            st = st.replace(' ', '.')
-            lst = st.split('.')
-            for item in lst:
-                if item in self._ind_dct:
-                    out.append(self._ind_dct[item])
-                    continue
+        Returns:
+            tuple: A tuple of (index, exponent) pairs (see :mod:`spec`).
+            
+        Factors may have exponents of more than one digit (e.g. 'm10'). 
+        Where a factor could be read more than one way, the longest unit
+        abbreviation is used. For example, 'm2' is the square meter unit
+        rather than 'm' squared, if 'm2' is defined.
+        """
+        if s is None or s in ['', 'dimensionless']:
+            return ()
+        m = _UNIT_STR.fullmatch(s)
+        if m is None:
+            self._str_error(s)
+        o1, num, c1, o2, den, c2 = m.groups()
+        opens = (o1 is not None) + (o2 is not None)
+        closes = (c1 is not None) + (c2 is not None)
+        if opens != closes or opens > 1:
+            self._str_error(s)
+        if num.strip() in ['1', '1.0']:
+            num = ''
+        get = self._ind_dct.get
+        out = {}
+        for item in _ITEM.findall(num):
+            ind = get(item)
+            if ind is None:
+                ind, n = self._parse_item(item)
+            else:
                 n = 1
-                if item[-1].isnumeric():
-                    n = int(item[-1])
-                    item = item[:-1]
-                if item in self._ind_dct:
-                    for i in range(n):
-                        out.append(self._ind_dct[item])
-                    continue
-                raise ValueError('Unit "' + str(item) + '" not recognised.')
-            return out
-
-        num_lst = process(num)
-        den_lst = process(den)
-        den_lst = [-s for s in den_lst]
-        return num_lst + den_lst
-
-    def from_str(self, s):
+            out[ind] = out.get(ind, 0) + n
+        if den:
+            for item in _ITEM.findall(den):
+                ind = get(item)
+                if ind is None:
+                    ind, n = self._parse_item(item)
+                else:
+                    n = 1
+                out[ind] = out.get(ind, 0) - n
+        return make_spec(out.items())
+
+    def _cache_key(self, s):
+        """ Return a string with consistent spacing for use as a cache key """
+        s = _SEP_SPACES.sub(r'\1', s.strip())
+        return _SPACES.sub('.', s)
+
+    def from_str(self, s, pin=False):
+        """ Return the Unit for a unit string, deriving it if necessary
+        
+        Args:
+            s (str): The unit string (e.g. 'kg/(s2.m)')
+            pin (bool): [Optional] If True, a derived unit is permanently
+                added to the units and indices, like units that are loaded
+                from the specification. Otherwise, derived units are held
+                in the :attr:`cache`.
+                
+        Returns:
+            Unit: The Unit instance.
+            
+        Note:
+            Derived units are keyed by their spec (see :mod:`spec`), so
+            equivalent strings such as 
+            'm.kg/s2', 'kg.m/s2' and 'kg m/(s.s)' share one Unit. Its
+            abbreviation is the canonical string (see :meth:`canonical`).
+            The spec for each string is held in a separate cache, so each
+            call counts as one lookup in :attr:`cache`.
+        """
         if s in self.units:
             return self.units[s]
-        spec = self.spec_from_str(s)
-        index = self._ind(s)
-        units = [self.get_by_index(i) for i in spec]
-        vector = np.sum([u.vector for u in units], axis=0)
-        value = np.prod([u.value for u in units])
-        name = s
-        utype = 0
-        return self.new(index, value, vector, spec, name, utype)
+        key = self._cache_key(s)
+        if key in self.units:
+            return self.units[key]
+        spec = self._spellings.get(key)
+        if spec is None:
+            spec = self.spec_from_str(key)
+            self._spellings.put(key, spec)
+        u = None if pin else self.cache.get(spec)
+        if u is None:
+            abbr = self.str_spec(spec)
+            if abbr in self.units and self.units[abbr].spec == spec:
+                u = self.units[abbr] # e.g. a compound unit pinned earlier
+            else:
+                if abbr in self.units:
+                    # e.g. 'mm.mm' is not the defined unit 'mm2' (1e-3 m2)
+                    abbr = key
+                u = self._from_spec(abbr, spec, pin)
+            if not pin:
+                self.cache.put(spec, u)
+        return u
+
+    def factor_table(self, vector):
+        """ Return the conversion factors between units of one dimension
         
-    
\ No newline at end of file
+        Args:
+            vector (ndarray): The dimension vector.
+            
+        Returns:
+            tuple: A dictionary of the position of each unit index, and an
+            ndarray of factors. Multiplying a value in the unit at position
+            i by the factor at [i, j] expresses it in the unit at position j.
+            
+        Note:
+            Tables are built when first needed, and rebuilt if a unit with
+            the same dimensions is added.
+        """
+        key = self.dims.key(vector)
+        table = self._factors.get(key)
+        if table is None:
+            vector = self.dims.intern(vector)
+            us = [(abbr, value) for abbr, value, spec, v, name 
+                  in self.units.records() if v is vector]
+            pos = {self._ind_dct[abbr]: j for j, (abbr, v) in enumerate(us)}
+            values = np.array([value for abbr, value in us])
+            table = (pos, values[:, None] / values[None, :])
+            self._factors[key] = table
+        return table
+
+    def convert(self, values, from_abbr, to_abbr):
+        """ Convert values from one unit to another
+        
+        Args:
+            values (float, arraylike): The values in the from_abbr units.
+            from_abbr (str): The unit string that the values are in.
+            to_abbr (str): The unit string to convert to.
+            
+        Returns:
+            float, ndarray: The values in the to_abbr units.
+            
+        Example:
+        ::
+            
+            units.convert([100, 200], 'psi', 'kPa')
+        """
+        factor = self._pairs.get((from_abbr, to_abbr))
+        if factor is None:
+            factor = self._factor(from_abbr, to_abbr)
+            self._pairs.put((from_abbr, to_abbr), factor)
+        if np.ndim(values):
+            return np.multiply(values, factor)
+        return values * factor
+
+    def _factor(self, from_abbr, to_abbr):
+        u_from = self[from_abbr]
+        u_to = self[to_abbr]
+        if u_from.vector is not u_to.vector:
+            raise ValueError('Incompatible quantity type')
+        pos, table = self.factor_table(u_from.vector)
+        i = pos.get(self._ind_dct.get(u_from.abbr))
+        j = pos.get(self._ind_dct.get(u_to.abbr))
+        if i is None or j is None:
+            return u_from.value / u_to.value # A derived unit
+        return float(table[i, j])
+
+    def _from_spec(self, abbr, spec, pin):
+        value = 1.0
+        vector = np.zeros(len(self.utypes))
+        for i, n in spec:
+            u = self.get_by_index(i if n > 0 else -i)
+            for k in range(abs(n)):
+                value *= u.value
+            vector = vector + u.vector * abs(n)
+        if pin:
+            index = self._ind(abbr)
+            return self.new(index, value, vector, spec, abbr, 0)
+        return Unit(value=value, spec=spec, vector=self.dims.intern(vector),
+                    abbr=abbr, name=abbr)
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 09:12:40 2026
+
+@author: Reuben
+
+The cache module provides a small, size-bounded, least-recently-used cache.
+
+It's used to hold items that can be rebuilt cheaply if needed, but that
+would otherwise accumulate without limit. For example, derived units
+created from strings like 'kg/(s2.m)' are kept in one of these caches
+rather than being permanently added to the Units instance.
+
+"""
+
+from collections import OrderedDict
+
+
+class LRUCache():
+    """ A size-bounded mapping that discards the least recently used items
+
+    Args:
+        maxsize (int): The maximum number of items to hold. When a new item
+            is added to a full cache, the least recently used item is
+            discarded. If None, the cache is unbounded.
+
+    The cache counts hits and misses from :meth:`get` so that its
+    effectiveness can be checked through :meth:`info`.
+    
+    The cache can be shared between threads. An item that another thread
+    evicts at the same time is treated as a miss. The counters may be
+    slightly out in that case.
+
+    """
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self._dct = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._dct)
+
+    def __contains__(self, key):
+        return key in self._dct
+
+    def get(self, key, default=None):
+        """ Return a cached item and mark it as recently used
+
+        Args:
+            key (hashable): The key for the item.
+            default: [Optional] The value to return if the key is not
+                cached.
+
+        Returns:
+            The cached item, or the default if it is not present.
+        """
+        try:
+            val = self._dct[key]
+            self._dct.move_to_end(key)
+        except KeyError:
+            self.misses += 1
+            return default
+        self.hits += 1
+        return val
+
+    def put(self, key, val):
+        """ Add an item, discarding the least recently used if full
+
+        Args:
+            key (hashable): The key for the item.
+            val: The item to store.
+        """
+        self._dct[key] = val
+        try:
+            self._dct.move_to_end(key)
+            if self.maxsize is not None:
+                while len(self._dct) > self.maxsize:
+                    self._dct.popitem(last=False)
+        except KeyError:
+            pass # Evicted or cleared by another thread
+
+    def clear(self):
+        """ Remove all items and reset the hit and miss counters """
+        self._dct.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self):
+        """ Return cache statistics
+
+        Returns:
+            dict: The number of hits, misses, the fraction of lookups that
+            were hits, the current size and the maximum size.
+        """
+        total = self.hits + self.misses
+        return {'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / total if total else 0.0,
+                'size': len(self._dct),
+                'maxsize': self.maxsize}
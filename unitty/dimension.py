@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 08:31:27 2026
+
+@author: Reuben
+
+The dimension module keeps track of dimension vectors.
+
+Each Quantity has a vector that contains the exponent of each base
+dimension (length, time, etc). Many Quantities share the same dimensions, so
+rather than each having its own array, the Dimensions registry in each Units
+instance holds one read-only array for each distinct dimension. That means
+checking whether two quantities are compatible is usually just an identity
+check, and the results of multiplying and dividing dimensions can be looked
+up rather than recalculated.
+
+"""
+
+import numpy as np
+
+
+def same(a, b):
+    """ Return True if two dimension vectors are equal
+
+    Args:
+        a (ndarray): A dimension vector.
+        b (ndarray): Another dimension vector.
+
+    Returns:
+        bool: True if the vectors are equal.
+    """
+    return a is b or np.array_equal(a, b)
+
+
+class Dimensions():
+    """ A registry of shared, read-only dimension vectors
+
+    Each distinct vector is given an integer key, in the order in which they
+    are registered. Vectors that have been registered are kept for the life
+    of the registry, so they can be recognised by identity.
+
+    """
+    def __init__(self):
+        self._vectors = {} # The array for each tuple of exponents
+        self._keys = {} # The integer key for the id of each array
+        self._mul = {} # Results of multiplying two arrays, by their ids
+        self._div = {} # Results of dividing two arrays, by their ids
+        self._inv = {} # Results of inverting an array, by its id
+        self._pow = {} # Results of raising an array to a power, by its id
+
+    def __len__(self):
+        return len(self._vectors)
+
+    def __contains__(self, vector):
+        return id(vector) in self._keys
+
+    def intern(self, vector):
+        """ Return the shared, read-only array for a dimension vector
+
+        Args:
+            vector (arraylike): The exponent of each base dimension.
+
+        Returns:
+            ndarray: A read-only array. Equal vectors always return the same
+            array.
+        """
+        if id(vector) in self._keys:
+            return vector
+        t = tuple(np.asarray(vector, dtype=float).tolist())
+        v = self._vectors.get(t)
+        if v is None:
+            v = np.array(t)
+            v.setflags(write=False)
+            self._vectors[t] = v
+            self._keys[id(v)] = len(self._keys)
+        return v
+
+    def adopt(self, table):
+        """ Register each row of a 2D array as a shared vector, without copying
+
+        Args:
+            table (ndarray): A 2D array with one distinct dimension vector in
+                each row. The array is made read-only.
+
+        Returns:
+            list[ndarray]: The shared array for each row. Rows that are
+            equal to a vector that was already registered return that
+            vector instead.
+        """
+        if table.flags.writeable:
+            table.setflags(write=False)
+        out = []
+        for row in table:
+            t = tuple(row.tolist())
+            v = self._vectors.get(t)
+            if v is None:
+                v = row
+                self._vectors[t] = v
+                self._keys[id(v)] = len(self._keys)
+            out.append(v)
+        return out
+
+    def key(self, vector):
+        """ Return the integer key for a dimension vector
+
+        Args:
+            vector (arraylike): The exponent of each base dimension.
+
+        Returns:
+            int: The key, which is unique to each distinct vector.
+        """
+        return self._keys[id(self.intern(vector))]
+
+    def _lookup(self, dct, a, b, func):
+        v = self.intern(func(a, b, dtype=float))
+        if id(a) in self._keys and id(b) in self._keys:
+            dct[(id(a), id(b))] = v
+        return v
+
+    def mul(self, a, b):
+        """ Return the dimension vector for the product of two quantities """
+        try:
+            return self._mul[(id(a), id(b))]
+        except KeyError:
+            return self._lookup(self._mul, a, b, np.add)
+
+    def div(self, a, b):
+        """ Return the dimension vector for the quotient of two quantities """
+        try:
+            return self._div[(id(a), id(b))]
+        except KeyError:
+            return self._lookup(self._div, a, b, np.subtract)
+
+    def inv(self, a):
+        """ Return the dimension vector for the inverse of a quantity """
+        try:
+            return self._inv[id(a)]
+        except KeyError:
+            pass
+        v = self.intern(np.negative(a, dtype=float))
+        if id(a) in self._keys:
+            self._inv[id(a)] = v
+        return v
+
+    def pow(self, a, n):
+        """ Return the dimension vector for a quantity raised to a power """
+        try:
+            return self._pow[(id(a), n)]
+        except KeyError:
+            pass
+        v = self.intern(np.multiply(a, n, dtype=float))
+        if id(a) in self._keys:
+            self._pow[(id(a), n)] = v
+        return v
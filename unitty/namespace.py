@@ -12,14 +12,29 @@ Each set of Units, Quantity, Systems, and System objects are designed to be
 instantiated in groups through the :func:`setup` function. This is called
 if required to set up the default units.
 
+The active group and the active unit system in each group are global
+defaults, set by :func:`setup` and :func:`set_system`. They can be
+overridden within a block of code with the :func:`using_group` and 
+:func:`using_system` context managers. The overrides are held in context
+variables, so they only apply to the current thread or asyncio task. That
+allows, for example, several threads to format output in different unit
+systems at the same time.
+
 """
 
+import threading
+import contextlib
+import contextvars
+
 Units = None # Replaced by real class
 Systems = None  # Replaced by real class
 
 active = None
 container = {}
 
+_group = contextvars.ContextVar('unitty_group', default=None)
+_lock = threading.RLock() # Held while groups are set up
+
 def _inject(Units_cls, Systems_cls):
     """ Inject these classes to prevent circular dependency """
     global Units, Systems
@@ -28,10 +43,12 @@ def _inject(Units_cls, Systems_cls):
 
 def _ensure_exists(group=None):
     """ Sets up the default group if needed"""
-    group = active if group is None else group
+    group = get_active() if group is None else group
     if group is None:
-        setup('default')
-        group = 'default'
+        with _lock:
+            if active is None:
+                setup('default')
+            group = get_active()
     return group
     
 
@@ -77,7 +94,52 @@ def get_system(group=None):
 
 def get_active():
     """ Return a string of the currently active group """
-    return active
+    group = _group.get()
+    return active if group is None else group
+
+@contextlib.contextmanager
+def using_group(group):
+    """ Make a group active within a block of code
+    
+    Args:
+        group (str): The name of the group.
+        
+    The group is only active for the current thread or asyncio task.
+    
+    Example:
+    ::
+        
+        with unitty.using_group('test'):
+            u = unitty.get_units()
+            
+    """
+    token = _group.set(group)
+    try:
+        yield
+    finally:
+        _group.reset(token)
+
+def using_system(sys_name, group=None):
+    """ Make a unit system active within a block of code
+    
+    Args:
+        sys_name (str): The name of the unit system to activate.
+        group (str): [Optional] The name of the group. Defaults to the
+            currently active group.
+            
+    Returns:
+        A context manager. The system is only active for the current thread
+        or asyncio task. See :meth:`system.Systems.using`.
+    
+    Example:
+    ::
+        
+        with unitty.using_system('US'):
+            print(q.str_in_sys())
+            
+    """
+    group = _ensure_exists(group)
+    return get_systems(group).using(sys_name)
 
 def set_system(sys_name, group=None):
     """ Make the named unit system active
@@ -110,14 +172,47 @@ def setup(group='default',
             for the Systems class. If omitted, the default is loaded.
         sys_raw (dict): [Optional] A dictionary of data to use for the unit
             systems. If given, sys_fname should not be given.
+            
+    Note:
+        The group is fully built before it is added, so other threads
+        never see a partly built group.
         
     """
+    with _lock, using_group(group):
+        units = Units(fname=units_fname, raw=units_raw)
+        systems = Systems(fname=sys_fname, raw=sys_raw, units=units)
+        _publish(group, units, systems)
+
+def freeze(group=None):
+    """ Freeze the Units instance of a group
+    
+    Args:
+        group (str): [Optional] The name of the group. Defaults to the 
+            currently active group.
+    
+    See :meth:`base.Units.freeze`. This is best done in a parent process
+    before forking workers, after any reference units have been set. 
+    Calling `gc.freeze()` as well stops the garbage collector from touching
+    (and so copying) the objects the workers inherit.
+    
+    Example:
+    ::
+        
+        unitty.setup('default')
+        unitty.freeze()
+        gc.freeze()
+        # Now fork the workers
+        
+    """
+    group = _ensure_exists(group)
+    with _lock, using_group(group):
+        get_units(group).freeze()
+
+def _publish(group, units, systems):
+    """ Add a fully built group and make it the active group """
     global active
-    container[group] = {}
-    active = group
-    units = Units(fname=units_fname, raw=units_raw)
-    container[group]['units'] = units
-    systems = Systems(fname=sys_fname, raw=sys_raw)
-    container[group]['systems'] = systems
+    with _lock:
+        container[group] = {'units': units, 'systems': systems}
+        active = group
     
 
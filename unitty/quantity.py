@@ -18,24 +18,31 @@ force, pressure, etc.
 
 """
 
-from . import settings, get_active, get_units, get_systems
+from . import settings, get_active, get_units, get_systems, namespace
+from .dimension import same, Dimensions
+from .spec import make_spec, mul_spec, div_spec, inv_spec, pow_spec
 import numpy as np
 
 from collections import namedtuple
 
 Quantity_Tuple = namedtuple('Quantity_Tuple', ['value', 'units'])
 
+# For Quantities that do not belong to a group of units
+_dimensions = Dimensions()
+
 class Quantity():
     """ The core object that combines magnitude and dimensional information.
     
     Args:
         value (int, float, arraylike) : A float representing the magnitude of
             the quantity in terms of base dimensions (length, time, mass, etc)
-            spec: A list of signed integers. For simple units, there will be
-            only one integer. For compound units (e.g. m/s), there will be
-            more than one. The integers correspond to other Quantities.
-            Positive integers indicate the are multiplied, while negative
-            integers indicate they are divided.
+        spec (tuple): A tuple of (index, exponent) pairs. For simple units,
+            there will be only one pair. For compound units (e.g. m/s), there
+            will be more than one. The indices correspond to other
+            Quantities, and the exponents indicate the power to which they
+            are raised. Negative exponents indicate they are divided. See
+            the :mod:`spec` module. A list of signed integers, as used by
+            earlier versions, is also accepted.
         vector (ndarray): Each base dimensions is independent, and the exponent
             for each base dimension is represented as a number. This vectore is
             an array of such numbers for all base dimensions. This allows quick
@@ -50,12 +57,19 @@ class Quantity():
         Normally, Quantities would only be created automatically or from
         other Quantities, not directly by the user.
         
+        Quantities use slots rather than an instance dictionary to keep them
+        small, since many of them may be created. Vectors are expected to
+        be the shared, read-only arrays created by the Units instance (see
+        :mod:`dimension`).
+        
 """
+    __slots__ = ('value', 'spec', 'vector', 'abbr', 'name', '_parent',
+                 '_ref')
     
     def __init__(self, value, spec, vector, abbr=None, name=None,
                  parent=None):
         self.value = value
-        self.spec = spec
+        self.spec = make_spec(spec)
         self.vector = vector
         self.abbr = abbr
         self.name = name
@@ -68,7 +82,7 @@ class Quantity():
         Args:
             unit (Quantity): A Quantity or Unit instance.
         """
-        if any(unit.vector != self.vector):
+        if not same(unit.vector, self.vector):
             raise ValueError('Incompatible quantity type')
         self.spec = unit.spec
         self.abbr = unit.abbr if unit.abbr is not None else None
@@ -94,7 +108,7 @@ class Quantity():
             Quantity_Tuple: A value and unit string tuple.
         """
         if unit is not None:
-            if any(unit.vector != self.vector):
+            if not same(unit.vector, self.vector):
                 raise ValueError('Incompatible quantity type')
             spec = unit.spec
         else:
@@ -197,41 +211,46 @@ class Quantity():
     def __repr__(self):
         return self.str_in_sys()
 
+    def _dims(self):
+        """ Return the dimension registry for this Quantity's units """
+        try:
+            return namespace.container[self._parent]['units'].dims
+        except KeyError:
+            return _dimensions
+
     def _get_quantity(self, quantity, value, spec, vector):
         if settings['always_make_quantities']:
-            return Quantity(value=value, spec=spec, vector=vector,
-                            parent=self._parent)
+            return _new(value, spec, vector, self._parent)
         else:
             return value
 
     def __add__(self, other):
-        quantity = isinstance(other, Quantity)
-        if not quantity:
+        if not isinstance(other, Quantity):
             raise NotImplementedError('Quantity instances can only be added '
                                       + 'to Quantity instances.')
-        if quantity:
-            if any(other.vector != self.vector):
-                raise ValueError('Incompatible units.')
-        return Quantity(self.value + other.value, spec=self.spec,
-                        vector=self.vector, parent=self._parent)
+        if other.vector is not self.vector and not same(other.vector,
+                                                        self.vector):
+            raise ValueError('Incompatible units.')
+        return _new(self.value + other.value, self.spec, self.vector,
+                    self._parent)
 
     def __sub__(self, other):
-        quantity = isinstance(other, Quantity)
-        if not quantity:
+        if not isinstance(other, Quantity):
             raise NotImplementedError('Quantity instances can only be added '
                                       + 'to Quantity instances.')
-        if quantity:
-            if any(other.vector != self.vector):
-                raise ValueError('Incompatible units.')
-        return Quantity(self.value - other.value, spec=self.spec,
-                        vector=self.vector, parent=self._parent)
+        if other.vector is not self.vector and not same(other.vector,
+                                                        self.vector):
+            raise ValueError('Incompatible units.')
+        return _new(self.value - other.value, self.spec, self.vector,
+                    self._parent)
 
     def __mul__(self, other):
-        quantity = isinstance(other, Quantity)
-        if quantity:
+        if isinstance(other, Quantity):
             return self._mul(other)
-        return self._get_quantity(quantity, self.value * other, spec=self.spec,
-                        vector=self.vector)
+        if settings['always_make_quantities']:
+            return _new(self.value * other, self.spec, self.vector,
+                        self._parent)
+        return self.value * other
         
     def __pow__(self, other, modulo=None):
         if not isinstance(other, int):
@@ -246,66 +265,61 @@ class Quantity():
                         vector=self.vector)
     
     def __truediv__(self, other):
-        quantity = isinstance(other, Quantity)
-        if quantity:
+        if isinstance(other, Quantity):
             return self._div(other)
-        return self._get_quantity(quantity, self.value / other, spec=self.spec,
-                        vector=self.vector)
+        if settings['always_make_quantities']:
+            return _new(self.value / other, self.spec, self.vector,
+                        self._parent)
+        return self.value / other
 
     def __rmul__(self, other):
-        quantity = isinstance(other, Quantity)
-        if quantity:
+        if isinstance(other, Quantity):
             return self._mul(other)
-        return self._get_quantity(quantity, self.value * other, spec=self.spec,
-                        vector=self.vector)
+        if settings['always_make_quantities']:
+            return _new(self.value * other, self.spec, self.vector,
+                        self._parent)
+        return self.value * other
 
     def __rtruediv__(self, other):
-        quantity = isinstance(other, Quantity)
-        if quantity:
+        if isinstance(other, Quantity):
             return self._div(other)
-        return self._get_quantity(quantity, other / self.value,
-                        spec=[-u for u in self.spec],
-                        vector=-self.vector)
+        if settings['always_make_quantities']:
+            return _new(other / self.value, inv_spec(self.spec),
+                        self._dims().inv(self.vector), self._parent)
+        return other / self.value
     
     def _mul(self, other):
-        spec = self.spec.copy()
-        spec.extend(other.spec)
-        vector = self.vector + other.vector
-        return Quantity(self.value * other.value, spec=spec,
-                        vector=vector, parent=self._parent)
+        vector = self._dims().mul(self.vector, other.vector)
+        return _new(self.value * other.value,
+                    mul_spec(self.spec, other.spec), vector, self._parent)
 
     def _div(self, other):
-        spec = self.spec.copy()
-        spec.extend([-u for u in other.spec])
-        vector = self.vector - other.vector
-        return Quantity(value=self.value / other.value, spec=spec,
-                        vector=vector, parent=self._parent)
+        vector = self._dims().div(self.vector, other.vector)
+        return _new(self.value / other.value,
+                    div_spec(self.spec, other.spec), vector, self._parent)
 
     def _pow(self, other):
-        new = self
         if other % 1 != 0:
             raise ValueError('Units can only be raised to integer powers.')
-        for n in range(other - 1):
-            new = new._mul(self)
-        return new
+        vector = self._dims().pow(self.vector, other)
+        return _new(self.value ** other, pow_spec(self.spec, other),
+                    vector, self._parent)
             
     def __rlshift__(self, other):
-        quantity = isinstance(other, Quantity)
-        if quantity:
+        if isinstance(other, Quantity):
             return self._mul(other)
-        return Quantity(value=self.value * other, spec=self.spec,
-                        vector=self.vector, parent=self._parent)
+        return _new(self.value * other, self.spec, self.vector, self._parent)
     
     def __rrshift__(self, other):
         return other / self.value
     
-    def __array__(self):
+    def __array__(self, dtype=None, copy=None):
         ''' For numpy 
         
         See:
             https://numpy.org/devdocs/user/basics.dispatch.html
         '''
-        return np.array(self.value)
+        return np.array(self.value, dtype=dtype)
     
     def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
         ''' For numpy 
@@ -314,25 +328,34 @@ class Quantity():
             https://numpy.org/devdocs/user/basics.dispatch.html
         '''
         ufunc_name = ufunc.__name__
-        if method != '__call__':
+        if method != '__call__' or kwargs:
             return NotImplemented
-        quantity = isinstance(inputs[0], Quantity)
+        first = inputs[0] is self
         if ufunc_name=='multiply':
-            value = inputs[0] * inputs[1].value
-            return self._get_quantity(quantity, value,
-                                      spec=self.spec, vector=self.vector)
-
-        elif ufunc_name=='true_divide':
-            value = inputs[0] / inputs[1].value
-            return self._get_quantity(quantity, value,
-                                      spec=self.spec, vector=self.vector)
-        elif ufunc_name=='left_shift':
-            return Quantity(value=inputs[0] * inputs[1].value, spec=self.spec,
-                        vector=self.vector, parent=self._parent)
-        elif ufunc_name=='right_shift':
-            return inputs[0] * inputs[1].value
+            if first:
+                return self.__mul__(inputs[1])
+            return self.__rmul__(inputs[0])
+        elif ufunc_name in ['divide', 'true_divide']:
+            if first:
+                return self.__truediv__(inputs[1])
+            return self.__rtruediv__(inputs[0])
+        elif ufunc_name=='left_shift' and not first:
+            return self.__rlshift__(inputs[0])
+        elif ufunc_name=='right_shift' and not first:
+            return self.__rrshift__(inputs[0])
         return NotImplemented
-            
-    
 
 
+def _new(value, spec, vector, parent):
+    """ Make a Quantity quickly, without the conversions in __init__ """
+    q = _object_new(Quantity)
+    q.value = value
+    q.spec = spec
+    q.vector = vector
+    q.abbr = None
+    q.name = None
+    q._parent = parent
+    q._ref = None
+    return q
+
+_object_new = object.__new__
@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 15:20:43 2026
+
+@author: Reuben
+
+The snapshot module saves a fully built group of Units and Systems to a
+single file, and loads it back much faster than the group can be set up
+from yaml files.
+
+A snapshot is a numpy .npz file. It holds arrays of unit values, vectors
+and specs, a table of the unit strings, and the unit multipliers for each
+system. No Python objects are pickled. The raw data is stored as json, so
+that it is available (e.g. to start worker processes) without reading
+the yaml files.
+
+Each snapshot records a format version and a sha256 hash of the yaml files
+(or raw data) it was built from. By default, loading a snapshot checks those
+hashes against the files, and raises a ValueError if they have changed or
+no longer exist.
+
+Example:
+::
+
+    unitty.setup('default')
+    unitty.snapshot.save('units.npz')
+
+    # Later, in another process
+    unitty.snapshot.load('units.npz')
+
+The same arrays can be placed in a shared memory block with :func:`share`,
+and other processes can then :func:`attach` to it. The units in those
+processes are frozen (see :meth:`base.Units.freeze`) and use the shared
+arrays directly, rather than each holding a copy.
+
+Example:
+::
+
+    shm = unitty.snapshot.share()
+
+    # In each worker process
+    unitty.snapshot.attach(shm.name)
+
+    # In the parent, once the workers have finished
+    shm.close()
+    shm.unlink()
+
+"""
+
+import os
+import json
+import hashlib
+import numpy as np
+from multiprocessing import shared_memory
+
+from . import namespace
+from .base import Units
+from .system import Systems
+
+VERSION = 2
+_ALIGN = 16 # The byte alignment of each array in shared memory
+_attached = {} # The shared memory block for each group that is attached
+
+
+def source_hash(fname=None, raw=None):
+    """ Return the sha256 hash of a yaml file, or raw data if fname is None
+
+    Args:
+        fname (str): [Optional] The filename.
+        raw (dict): [Optional] The raw data.
+
+    Returns:
+        str: The hexadecimal digest.
+    """
+    if fname is not None:
+        with open(fname, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    s = json.dumps(raw, sort_keys=True)
+    return hashlib.sha256(s.encode('utf-8')).hexdigest()
+
+
+def _header(obj):
+    """ Return the header strings for a Units or Systems instance """
+    return [obj.fname or '', source_hash(obj.fname, obj.raw),
+            json.dumps(obj.raw)]
+
+
+def _arrays(group):
+    """ Return all the arrays for a snapshot of a group """
+    units = namespace.get_units(group)
+    systems = namespace.get_systems(group)
+    arrays = {'version': np.array(VERSION),
+              'header_units': np.array(_header(units), dtype=str),
+              'header_systems': np.array(_header(systems), dtype=str)}
+    arrays.update({'units_' + k: v for k, v in units.to_arrays().items()})
+    arrays.update({'systems_' + k: v for k, v in systems.to_arrays().items()})
+    return arrays
+
+
+def save(fname, group=None):
+    """ Save a snapshot of a group
+
+    Args:
+        fname (str): The filename, which should end with '.npz'.
+        group (str): [Optional] The name of the group. Defaults to the
+            active group.
+    """
+    arrays = _arrays(group)
+    with open(fname, 'wb') as f:
+        np.savez(f, **arrays)
+
+
+def _check(header):
+    """ Check that a source file has not changed since a snapshot """
+    source, digest = header[:2]
+    if not source:
+        return
+    if not os.path.isfile(source):
+        raise ValueError('Snapshot source missing: ' + source
+                         + ' does not exist.')
+    if source_hash(source) != digest:
+        raise ValueError('Snapshot is out of date: ' + source
+                         + ' has changed.')
+
+
+def _restore(data, group, check, freeze):
+    """ Create a group from the arrays of a snapshot """
+    if int(data['version']) != VERSION:
+        raise ValueError('Snapshot version ' + str(int(data['version']))
+                         + ' is not supported.')
+    units_header = data['header_units'].tolist()
+    systems_header = data['header_systems'].tolist()
+    if check:
+        _check(units_header)
+        _check(systems_header)
+    units_arrays = {k[6:]: v for k, v in data.items()
+                    if k.startswith('units_')}
+    systems_arrays = {k[8:]: v for k, v in data.items()
+                      if k.startswith('systems_')}
+    with namespace.using_group(group):
+        units = Units.from_arrays(units_arrays,
+                                  raw=json.loads(units_header[2]),
+                                  fname=units_header[0] or None,
+                                  freeze=freeze)
+        systems = Systems.from_arrays(systems_arrays,
+                                      raw=json.loads(systems_header[2]),
+                                      fname=systems_header[0] or None,
+                                      units=units)
+    namespace._publish(group, units, systems)
+
+
+def load(fname, group='default', check=True, freeze=False):
+    """ Load a snapshot into a group and make it active
+
+    Args:
+        fname (str): The snapshot filename.
+        group (str): [Optional] The name of the group.
+        check (bool): [Optional] If True, check that the yaml files from
+            which the snapshot was built have not changed.
+        freeze (bool): [Optional] If True, the units are frozen (see 
+            :meth:`base.Units.freeze`).
+
+    Raises:
+        ValueError: If the snapshot version is not supported, or a yaml file
+            has changed or is missing.
+    """
+    with np.load(fname, allow_pickle=False) as data:
+        arrays = {k: data[k] for k in data.files}
+    _restore(arrays, group, check, freeze)
+
+
+def share(group=None):
+    """ Copy a snapshot of a group into a new shared memory block
+    
+    Args:
+        group (str): [Optional] The name of the group. Defaults to the
+            active group.
+    
+    Returns:
+        SharedMemory: The shared memory block. Other processes can attach to
+        it by its name (see :func:`attach`). The caller is responsible for
+        closing and unlinking it when it is no longer needed.
+    """
+    arrays = {k: np.require(v, requirements='C')
+              for k, v in _arrays(group).items()}
+    layout = []
+    size = 0
+    for k, v in arrays.items():
+        layout.append([k, v.dtype.str, list(v.shape), size])
+        size += -(-v.nbytes // _ALIGN) * _ALIGN
+    header = json.dumps(layout).encode('utf-8')
+    start = -(-(8 + len(header)) // _ALIGN) * _ALIGN
+    shm = shared_memory.SharedMemory(create=True, size=max(start + size, 1))
+    shm.buf[:8] = np.array(len(header), dtype='<u8').tobytes()
+    shm.buf[8:8 + len(header)] = header
+    for (k, dtype, shape, offset), v in zip(layout, arrays.values()):
+        out = np.ndarray(tuple(shape), dtype=dtype, buffer=shm.buf,
+                         offset=start + offset)
+        out[...] = v
+    return shm
+
+
+def attach(name, group='default', check=True):
+    """ Create a group from a snapshot in shared memory and make it active
+    
+    Args:
+        name (str): The name of the shared memory block (see :func:`share`).
+        group (str): [Optional] The name of the group.
+        check (bool): [Optional] If True, check that the yaml files from
+            which the snapshot was built have not changed.
+    
+    The units are frozen, and use the arrays in the shared memory block
+    without copying them. The block stays open while the group uses it.
+    
+    Raises:
+        ValueError: If the snapshot version is not supported, or a yaml file
+            has changed or is missing.
+    """
+    try:
+        shm = shared_memory.SharedMemory(name=name, track=False)
+    except TypeError: # Python < 3.13
+        shm = shared_memory.SharedMemory(name=name)
+    n = int(np.frombuffer(shm.buf, dtype='<u8', count=1)[0])
+    layout = json.loads(bytes(shm.buf[8:8 + n]).decode('utf-8'))
+    start = -(-(8 + n) // _ALIGN) * _ALIGN
+    arrays = {}
+    for k, dtype, shape, offset in layout:
+        v = np.ndarray(tuple(shape), dtype=dtype, buffer=shm.buf,
+                       offset=start + offset)
+        v.setflags(write=False)
+        arrays[k] = v
+    _restore(arrays, group, check, freeze=True)
+    _attached[group] = shm
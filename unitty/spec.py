@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 11:20:36 2026
+
+@author: Reuben
+
+The spec module contains functions to create and combine specs.
+
+A spec describes the units in which a Quantity is expressed. It maps the
+index of each unit (see the :class:`base.Units` class) to an exponent. For
+example, if 'kg' has an index of 4, 'm' of 2, and 's' of 6, then 'kg.m/s2'
+would have a spec of::
+
+    ((2, 1), (4, 1), (6, -2))
+
+Specs are tuples of (index, exponent) pairs. Each index is positive, each
+exponent is a non-zero integer, and the pairs are sorted by index. That
+means that equivalent specs are always equal and can be used as dictionary
+keys. Multiplying and dividing specs combines the exponents, so units
+cancel automatically and specs never hold more than one pair per unit.
+
+The functions that combine specs are cached, since the same combinations
+tend to be needed over and over again.
+
+"""
+
+from functools import lru_cache
+
+
+def make_spec(spec):
+    """ Make a spec
+
+    Args:
+        spec (list): Either a list of (index, exponent) pairs, or a list of
+            signed indices, in which a negative index indicates that the
+            unit is divided. Indices may be repeated. For example,
+            [2, 4, -6, -6] gives the same spec as [(2, 1), (4, 1), (6, -2)].
+
+    Returns:
+        tuple: The spec.
+    """
+    d = {}
+    for item in spec:
+        if isinstance(item, (tuple, list)):
+            i, n = item
+        else:
+            i, n = item, 1
+        if i < 0:
+            i, n = -i, -n
+        d[i] = d.get(i, 0) + n
+    return tuple(sorted((i, n) for i, n in d.items() if n != 0))
+
+
+@lru_cache(maxsize=4096)
+def mul_spec(spec, other):
+    """ Return the spec for the product of two specs """
+    if not spec:
+        return other
+    if not other:
+        return spec
+    d = dict(spec)
+    for i, n in other:
+        d[i] = d.get(i, 0) + n
+    return tuple(sorted((i, n) for i, n in d.items() if n != 0))
+
+
+@lru_cache(maxsize=4096)
+def inv_spec(spec):
+    """ Return the spec for the inverse of a spec """
+    return tuple((i, -n) for i, n in spec)
+
+
+@lru_cache(maxsize=4096)
+def div_spec(spec, other):
+    """ Return the spec for one spec divided by another """
+    return mul_spec(spec, inv_spec(other))
+
+
+@lru_cache(maxsize=4096)
+def pow_spec(spec, power):
+    """ Return the spec for a spec raised to an integer power """
+    if power == 0:
+        return ()
+    return tuple((i, n * power) for i, n in spec)
@@ -25,14 +25,50 @@ but would use api functions.
 """
 
 import os
-import ruamel.yaml as yaml
+import math
+import bisect
+import contextlib
+import contextvars
 import numpy as np
-import pprint
-from . import get_units, get_active
+from . import get_units, get_active, settings
+from .spec import make_spec
+from .cache import LRUCache
+from .base import load_yaml
 
 root = os.path.dirname(os.path.abspath(__file__))
 
 
+def _magnitude(val):
+    """ Return the decade of a value, or None if it has no magnitude """
+    if np.ndim(val) == 0:
+        m = abs(val)
+    else:
+        with np.errstate(all='ignore'):
+            m = float(np.mean(np.abs(val)))
+    if not m or not math.isfinite(m):
+        return None
+    return math.floor(math.log10(m))
+
+
+def _divide(units, val, i, n):
+    """ Divide a value by a unit raised to an integer power 
+    
+    Args:
+        units (Units): The Units instance.
+        val (float, arraylike): The value.
+        i (int): The unit index.
+        n (int): The exponent.
+    
+    Note:
+        The value is divided by the unit (or its inverse) once for each power
+        to give the same rounding as dividing by each unit in turn.
+    """
+    u = units.get_by_index(i if n > 0 else -i).value
+    for k in range(abs(n)):
+        val = val / u
+    return val
+
+
 class Systems():
     """ Manage multiple unit systems and allow switching between them
     
@@ -43,13 +79,33 @@ class Systems():
         raw (dict): [Optional] If passed when fname is omitted, this
             data is used to initialise the instance. See the :meth:`load`
             method for details on structure.
+        cache_size (int): [Optional] The maximum number of results to keep
+            in the :attr:`cache` of :meth:`unitise` results.
+        units (Units): [Optional] The Units instance to use. Defaults to
+            that of the active group.
+    
+    The active system set by :meth:`set_active` is a global default. It can
+    be overridden for the current thread or asyncio task with
+    :meth:`using`.
+    
+    When `settings['cache_unitise']` is True, :meth:`unitise` chooses the
+    output units once for each combination of system, spec and decade of
+    magnitude, and keeps the scale factor and unit string in :attr:`cache`.
+    This is much faster when many values share a spec. However, the units
+    are chosen for the first value seen in each decade, so a value
+    near a changeover point between units may be given different units
+    than it would otherwise. 
     
     """
-    def __init__(self, fname=None, raw=None):
+    def __init__(self, fname=None, raw=None, cache_size=1024, units=None):
         self._refs = {}
-        self._units = get_units(get_active())
+        self._ref_table = {}
+        self.cache = LRUCache(cache_size)
+        self._context = contextvars.ContextVar('unitty_system', default=None)
+        self._units = get_units(get_active()) if units is None else units
         if fname is None and raw is None:
             fname = os.path.join(root, 'systems') + '.yaml'
+        self.fname = fname if raw is None else None
         raw = self._load_raw(fname) if raw is None else raw
         self.load(raw)
     
@@ -81,17 +137,71 @@ class Systems():
             
         """
         self._sys_dct = self._make_sys_dct(raw)
+        self.raw = raw # Kept so that the systems can be recreated
+        self.cache.clear()
         for name in self._sys_dct.keys():
             self._active = name
             break
 
     def _load_raw(self, fname):
-        with open(fname, 'r') as f:
-            raw = yaml.safe_load(f)
-        return raw
+        return load_yaml(fname)
     
     def _make_sys_dct(self, raw):
-        return {n: System(dct) for n, dct in raw.items()}
+        return {n: System(dct, self._units) for n, dct in raw.items()}
+
+    @classmethod
+    def from_arrays(cls, arrays, raw=None, fname=None, cache_size=1024,
+                    units=None):
+        """ Create a Systems instance from the output of :meth:`to_arrays`
+        
+        Args:
+            arrays (dict): The arrays.
+            raw (dict): [Optional] The raw data the systems were loaded 
+                from.
+            fname (str): [Optional] The file the systems were loaded from.
+            cache_size (int): [Optional] The size of the cache.
+            units (Units): [Optional] The Units instance to use. Defaults 
+                to that of the active group.
+            
+        Returns:
+            Systems: The Systems instance.
+        """
+        self = cls.__new__(cls)
+        self._refs = {}
+        self._ref_table = {}
+        self.cache = LRUCache(cache_size)
+        self._context = contextvars.ContextVar('unitty_system', default=None)
+        self._units = get_units(get_active()) if units is None else units
+        self.fname = fname
+        self.raw = raw
+        dcts = {name: {} for name in arrays['names'].tolist()}
+        rows = zip(arrays['rows'].tolist(), arrays['mults'].tolist())
+        names = arrays['names'].tolist()
+        for (i, utype, unit), mult in rows:
+            dcts[names[i]].setdefault(utype, {})[unit] = mult
+        self._sys_dct = {name: System.from_dict(d, self._units)
+                         for name, d in dcts.items()}
+        self._active = names[0]
+        return self
+
+    def to_arrays(self):
+        """ Return the systems as a dictionary of arrays 
+        
+        Returns:
+            dict: A dictionary of numpy arrays, none of which contain
+            Python objects, from which :meth:`from_arrays` can recreate the
+            systems.
+        """
+        rows = []
+        mults = []
+        for i, system in enumerate(self._sys_dct.values()):
+            for utype, d in system._sys_dct.items():
+                for unit, mult in d.items():
+                    rows.append((i, utype, unit))
+                    mults.append(mult)
+        return {'names': np.array(list(self._sys_dct), dtype=str),
+                'rows': np.array(rows, dtype=np.int64).reshape(-1, 3),
+                'mults': np.array(mults, dtype=float)}
     
     def set_active(self, name):
         """ Set the currently active system 
@@ -99,8 +209,43 @@ class Systems():
         Args:
             name (str): The system name. 
             
+        Note:
+            This sets the default for all threads. Within a :meth:`using`
+            block, the system given to :meth:`using` stays active.
         """
         self._active = name
+        self.cache.clear()
+
+    @contextlib.contextmanager
+    def using(self, name):
+        """ Make a system active within a block of code
+        
+        Args:
+            name (str): The system name.
+            
+        The system is only active for the current thread or asyncio task,
+        so other threads and tasks can use other systems at the same time.
+        
+        Example:
+        ::
+            
+            with systems.using('US') as system:
+                val, unit_str = q.in_sys()
+                
+        """
+        if name not in self._sys_dct:
+            raise KeyError('System ' + repr(name) + ' is not defined.')
+        token = self._context.set(name)
+        try:
+            yield self._sys_dct[name]
+        finally:
+            self._context.reset(token)
+
+    @property
+    def active_name(self):
+        """ Return the name of the active system """
+        name = self._context.get()
+        return self._active if name is None else name
     
     @property
     def active(self):
@@ -109,7 +254,7 @@ class Systems():
         Returns:
             System: The active system.
         """
-        return self._sys_dct[self._active]
+        return self._sys_dct[self.active_name]
         
     def unitise(self, val, spec):
         """ Express a value in units specified by the active system.
@@ -117,7 +262,7 @@ class Systems():
         Args:
             val (float, arraylike): The value with respect to base dimensions
                 like length, time, etc.
-            spec (list[int]): A list of integers corresponding to the units
+            spec (tuple): A tuple of (index, exponent) pairs for the units
                 in which val is defined. These are used to indicate 
                 the dimensionality.
         
@@ -133,16 +278,118 @@ class Systems():
             than base dimensions (for force, this would be a combination of
             length, time, and distance). 
         """
-        return self._sys_dct[self._active].unitise(val, spec)
+        if settings['cache_unitise']:
+            return self._cached_unitise(val, spec)
+        return self.active.unitise(val, spec)
+
+    def _cached_unitise(self, val, spec):
+        key = (self.active_name, spec, _magnitude(val))
+        hit = self.cache.get(key)
+        if hit is None:
+            system = self.active
+            new_val, out_spec = system._unitise(val, spec)
+            # The string may not parse back to the same units (e.g. 'mm2'
+            # for mm.mm is the defined area unit), so use the spec
+            s = self._units.str_spec(out_spec)
+            hit = (system.typed_factor(out_spec)[0], s)
+            self.cache.put(key, hit)
+            return new_val, s
+        factor, s = hit
+        return val * factor, s
+
+    def unitise_elements(self, val, spec):
+        """ Express each element of an array in its own best units 
+        
+        Args:
+            val (arraylike): The values with respect to base dimensions.
+            spec (tuple): A tuple of (index, exponent) pairs for the units
+                in which val is defined.
+        
+        Returns:
+            tuple: An array of values, an array of the same shape
+            containing an integer code for the units of each value, and a
+            list of the unit strings for each code.
+            
+        Notes:
+            :meth:`unitise` chooses one unit for a whole array, which suits
+            arrays that span a narrow range. This method suits arrays that
+            span many orders of magnitude. Each element is given the units
+            that :meth:`unitise` would give it on its own. Zeros, NaN and 
+            inf are given the first unit in the system for each type.
+        """
+        return self.active.unitise_elements(val, spec)
+
+    def unitise_factor(self, val, spec):
+        """ Return the scale factor and string for the units :meth:`unitise` 
+        would choose for a value
+        
+        Args:
+            val (float): The value with respect to base dimensions.
+            spec (tuple): A tuple of (index, exponent) pairs for the units
+                in which val is defined.
+        
+        Returns:
+            tuple: The factor that values in base units must be multiplied
+            by to express them in the chosen units, and the unit string.
+            
+        Note:
+            The factor is worked out from the chosen units rather than by
+            parsing the unit string, which does not always give the same
+            units (e.g. 'mm2' for mm.mm is the defined area unit).
+        """
+        system = self.active
+        new_val, out_spec = system._unitise(val, spec)
+        return system.typed_factor(out_spec)[0], self._units.str_spec(out_spec)
+
+    def cache_info(self):
+        """ Return statistics for the cache of :meth:`unitise` results 
+        
+        Returns:
+            dict: The number of hits, misses, the hit rate, the current
+            size and the maximum size. See :meth:`cache.LRUCache.info`.
+        """
+        return self.cache.info()
 
     def base_unitise(self, val, vector, dimensional=False):
-        return self._sys_dct[self._active].base_unitise(val, vector,
+        return self.active.base_unitise(val, vector,
                             dimensional)
 
     def unitise_typed(self, val, spec):
-        return self._sys_dct[self._active].unitise_typed(val, spec)
+        return self.active.unitise_typed(val, spec)
+
+    def unitise_typed_batch(self, groups):
+        """ Express groups of values in given units 
+        
+        Args:
+            groups (list): A list of (values, unit) tuples, where values is
+                a float or arraylike in base units, and unit is a unit
+                string, a Unit, or a spec.
+        
+        Returns:
+            list: A list of (values, unit string) tuples, one per group.
+            
+        Notes:
+            The scale factor and unit string are worked out once per group,
+            and each group is then scaled with a single multiplication. This
+            is much faster than calling :meth:`unitise_typed` for each value,
+            though results may differ from it in the last decimal place.
+        """
+        return self.active.unitise_typed_batch(groups)
 
     def set_refs(self, source):
+        """ Set the units to use for named references 
+        
+        Args:
+            source (str, dict): A csv filename, or a dictionary. Each key 
+                of the dictionary is a reference name, and each value is a 
+                dictionary of the unit string to use for each system name.
+                In a csv file, the first column contains the reference
+                names, and there is a column for each system name.
+        
+        Note:
+            The unit for each reference in each system is looked up here,
+            rather than each time :meth:`by_ref` is called.
+        """
         if isinstance(source, str):
             if source.endswith('.csv'):
                 data = np.genfromtxt(source, delimiter=',', dtype='str')
@@ -154,22 +401,78 @@ class Systems():
         elif isinstance(source, dict):
             dct = source
         self._refs = dct
+        self._ref_table = self._make_ref_table(dct)
+    
+    def _make_ref_table(self, refs):
+        """ Return the unit value and string for each system and ref """
+        table = {}
+        for ref, d in refs.items():
+            for sys_name, unit_str in d.items():
+                try:
+                    u = self._units[unit_str]
+                except Exception:
+                    continue # Raise the error if the ref is used
+                table.setdefault(sys_name, {})[ref] = (u.value, unit_str)
+        return table
         
     def by_ref(self, val, ref):
+        try:
+            div, unit_str = self._ref_table[self.active_name][ref]
+        except KeyError:
+            return self._by_ref(val, ref)
+        return val / div, unit_str
+    
+    def _by_ref(self, val, ref):
         if ref not in self._refs:
             return None
-        unit_str = self._refs[ref][self._active]
+        unit_str = self._refs[ref][self.active_name]
         u = self._units[unit_str]
         value = val / u.value
         return value, unit_str
 
+    def by_refs(self, dct):
+        """ Express many values in the units for their references 
+        
+        Args:
+            dct (dict): The value (float or arraylike) for each reference
+                name.
+        
+        Returns:
+            dict: A value and unit string tuple for each reference name, or
+            None for references that haven't been set.
+        """
+        return {ref: self.by_ref(val, ref) for ref, val in dct.items()}
+
 
 class System():
-    def __init__(self, dct):
-        self._units = get_units(get_active())
+    def __init__(self, dct, units=None):
+        self._units = get_units(get_active()) if units is None else units
         self._sys_dct = self._make_sys_dct(dct)
+        self._tables = {} # Decision tables for scalar values
+        self._orders = LRUCache() # The order to choose units for each spec
+
+    @classmethod
+    def from_dict(cls, sys_dct, units=None):
+        """ Create a System from a dictionary of unit multipliers 
+        
+        Args:
+            sys_dct (dict): A dictionary of the unit multiplier for each 
+                unit index, for each utype index.
+            units (Units): [Optional] The Units instance to use. Defaults 
+                to that of the active group.
+        
+        Returns:
+            System: The System instance.
+        """
+        self = cls.__new__(cls)
+        self._units = get_units(get_active()) if units is None else units
+        self._sys_dct = sys_dct
+        self._tables = {}
+        self._orders = LRUCache()
+        return self
     
     def __str__(self):
+        import pprint
         d = {self._units.str(k): [self._units.str(v) for v in val]
                         for k, val in self._sys_dct.items()}
         return pprint.pformat(d)
@@ -183,89 +486,255 @@ class System():
             unit_dct = {}
             for abbr in units_raw:
                 if isinstance(abbr, list):
-                    unit = self._units[abbr[1]]
+                    unit = self._units.from_str(abbr[1], pin=True)
                     mult = abbr[0] * unit.value
                     a = self._units._ind(unit.abbr)
                 else:
-                    unit = self._units[abbr]
+                    unit = self._units.from_str(abbr, pin=True)
                     mult = unit.value
-                    a = self._units._ind(abbr)
+                    a = self._units._ind(unit.abbr)
                 unit_dct[a] = mult
             d[self._units._ind(spec)] = unit_dct
         return d
     
     def calc_utypes(self, vector):
+        """ Return a spec of base types for a dimension vector """
         utypes = []
         for n, name in zip(vector, self._units.utypes):
-            i = self._units._ind(name)
-            if n > 0:
-                utypes.extend([i]*int(abs(n)))
-            else:
-                utypes.extend([-i]*int(abs(n)))
-        return utypes
-
-    def _unitise_one(self, val, utype):
-        if abs(utype) not in self._sys_dct:
-            return val, utype
-        d = self._sys_dct[abs(utype)]
-        div = utype < 0
+            if n != 0:
+                utypes.append((self._units._ind(name), int(n)))
+        return make_spec(utypes)
+
+    def _unitise_one(self, val, utype, n=1):
+        """ Return the index of the best unit for a value 
+        
+        Args:
+            val (float, arraylike): The value.
+            utype (int): The index of the type of unit (e.g. length).
+            n (int): The exponent of the unit.
+            
+        Returns:
+            int: The index of the unit that gives a value closest to 10.
+        """
+        if utype not in self._sys_dct:
+            return self._units.bases.get(utype, utype)
+        if np.ndim(val) == 0:
+            return self._unitise_scalar(val, utype, n)
+        return self._unitise_trials(val, utype, n)
+
+    def _unitise_trials(self, val, utype, n):
+        """ Return the index of the best unit by trying each in turn """
+        d = self._sys_dct[utype]
         trials = []
         i_vals = []
         for i, mult in d.items():
-            if div:
-                trials.append(val * mult)
-                i_vals.append(-i)
-            else:
-                trials.append(val / mult)
-                i_vals.append(i)
+            trials.append(val / mult ** n)
+            i_vals.append(i)
         a = []
         for v in trials:
             num = np.mean(np.abs(np.atleast_1d(v)))
-            den = np.mean(10/np.abs(np.atleast_1d(v)))
+            with np.errstate(divide='ignore', over='ignore'):
+                den = np.mean(10/np.abs(np.atleast_1d(v)))
             a.append(np.max((num, den)))
         ind = a.index(min(a))
         return i_vals[ind]
 
-    def _base_unitise_one(self, val, spec, dimensional=False):
-        div = False
-        if spec < 0:
-            div = True
-        utype_i = abs(self._units._utypes[spec]) # length, force, etc
+    def _decision_table(self, utype, n):
+        """ Return the table used to choose units for scalar values 
+        
+        Args:
+            utype (int): The index of the type of unit (e.g. length).
+            n (int): The exponent of the unit.
+            
+        Returns:
+            tuple: A list of breakpoints, a list of (position, index, 
+            multiplier) tuples for each unit, sorted by size, the
+            index of the first unit, and the largest log10 magnitude for
+            which the table can be used.
+            
+        Note:
+            A unit is chosen to minimise max(x, 10/x), where x is the 
+            magnitude of the value in that unit. In log10 terms, that's the
+            unit that brings log10(x) closest to 0.5. The breakpoints are the
+            log10 magnitudes midway between those of neighbouring units.
+        """
+        key = (utype, n)
+        table = self._tables.get(key)
+        if table is not None:
+            return table
+        d = self._sys_dct[utype]
+        entries = sorted((n * math.log10(mult) + 0.5, k, i, mult)
+                         for k, (i, mult) in enumerate(d.items()))
+        centres = []
+        units = []
+        for c, k, i, mult in entries:
+            if centres and c == centres[-1]:
+                continue # Identical units - keep the first
+            centres.append(c)
+            units.append((k, i, mult))
+        breaks = [(a + b) / 2 for a, b in zip(centres[:-1], centres[1:])]
+        # Beyond this, trial values may overflow or underflow
+        limit = 300 - max(abs(c - 0.5) for c in centres)
+        table = (breaks, units, next(iter(d)), limit)
+        self._tables[key] = table
+        return table
+
+    def _unitise_scalar(self, val, utype, n, tol=1e-9):
+        """ Return the index of the best unit for a scalar value 
+        
+        This gives the same result as trying each unit in turn. Values that
+        fall within tol of a breakpoint are checked against both of
+        the neighbouring units, so that rounding can't change the choice.
+        Extremely large or small values are handled by trying each unit.
+        """
+        breaks, units, first, limit = self._decision_table(utype, n)
+        if not val or not math.isfinite(val):
+            return first
+        L = math.log10(abs(val))
+        if abs(L) > limit:
+            return self._unitise_trials(val, utype, n)
+        pos = bisect.bisect(breaks, L)
+        if pos > 0 and L - breaks[pos - 1] < tol:
+            return self._closest(val, n, units[pos - 1], units[pos])
+        if pos < len(breaks) and breaks[pos] - L < tol:
+            return self._closest(val, n, units[pos], units[pos + 1])
+        return units[pos][1]
+
+    def _unitise_elements(self, vals, utype, n, tol=1e-9):
+        """ Return an array of the best unit index for each value """
+        if utype not in self._sys_dct:
+            return np.full(vals.shape, self._units.bases.get(utype, utype))
+        breaks, units, first, limit = self._decision_table(utype, n)
+        out = np.full(vals.shape, first)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            L = np.log10(np.abs(vals))
+        ok = np.isfinite(L)
+        L = L[ok]
+        pos = np.searchsorted(breaks, L, side='right')
+        out[ok] = np.array([u[1] for u in units])[pos]
+        # Check values near breakpoints or of extreme size individually
+        b = np.concatenate(([-np.inf], breaks, [np.inf]))
+        check = ((L - b[pos] < tol) | (b[pos + 1] - L < tol)
+                 | (np.abs(L) > limit))
+        if check.any():
+            inds = np.flatnonzero(ok)[check]
+            out[inds] = [self._unitise_scalar(v, utype, n)
+                         for v in vals[inds].tolist()]
+        return out
+
+    def _closest(self, val, n, a, b):
+        """ Return the index of the better of two units for a value """
+        scores = []
+        for k, i, mult in (a, b):
+            v = abs(val / mult ** n)
+            scores.append((max(v, 10 / v if v else math.inf), k, i))
+        return min(scores)[2]
+
+    def _base_unitise_one(self, val, utype, n, dimensional=False):
+        utype_i = abs(self._units._utypes[utype]) # length, force, etc
         if not dimensional and utype_i in self._units.bases:
             b = self._units.bases[utype_i] # m, N etc
         else:
             b = utype_i
-        u = self._units.get_by_index(b)
-        if div:
-            return val * u.value, -b
-        return val / u.value, b
+        return _divide(self._units, val, b, n), b
     
-    def unitise(self, val, spec):
+    def _order(self, spec):
+        """ Return the factors of a spec in the order units are chosen for them
+        
+        Units are chosen one factor at a time, and each choice takes up 
+        some of the magnitude, so the order matters. A unit is chosen for
+        each power of a factor (e.g. 7e6 m/s2 gives 7 km/(ms.s)). The 
+        factors are taken in the order they appear in the unit string (see
+        :meth:`base.Units.str_spec`): the numerator before the denominator,
+        each sorted by abbreviation. For example, 4200 N.m gives 4.2 kN.m,
+        and 0.02 kg.m/s2 gives 20 g.m/s2.
+        
+        Returns:
+            tuple: A (index, 1) or (index, -1) pair for each power.
+        """
+        order = self._orders.get(spec)
+        if order is None:
+            units = self._units
+            pairs = sorted(spec, key=lambda p: (p[1] < 0, units.str(p[0])))
+            order = tuple((i, 1 if n > 0 else -1) 
+                          for i, n in pairs for k in range(abs(n)))
+            self._orders.put(spec, order)
+        return order
+    
+    def _unitise(self, val, spec):
+        """ Return the value and the spec of the units chosen for it """
         new_val = val
         out_spec = []
         utypes = self._units._utypes
-        utype = [utypes[s] for s in spec]
-        for u, s in zip(utype, spec):
-            ut = self._unitise_one(new_val, u)
-            new_val = new_val / self._units.get_by_index(ut).value
-            out_spec.append(ut)
-        s = self._units.str_spec(out_spec)
-        return new_val, s
+        for i, n in self._order(spec):
+            ut = self._unitise_one(new_val, utypes[i], n)
+            new_val = _divide(self._units, new_val, ut, n)
+            out_spec.append((ut, n))
+        return new_val, make_spec(out_spec)
     
+    def unitise(self, val, spec):
+        new_val, out_spec = self._unitise(val, spec)
+        return new_val, self._units.str_spec(out_spec)
+    
+    def unitise_elements(self, val, spec):
+        new_val = np.array(val, dtype=float)
+        flat = new_val.reshape(-1)
+        utypes = self._units._utypes
+        chosen = []
+        spec = self._order(spec)
+        for i, n in spec:
+            inds = self._unitise_elements(flat, utypes[i], n)
+            for ind in np.unique(inds).tolist():
+                mask = inds == ind
+                flat[mask] = _divide(self._units, flat[mask], ind, n)
+            chosen.append(inds)
+        if chosen:
+            uniq, codes = np.unique(np.stack(chosen), axis=1,
+                                    return_inverse=True)
+            ns = [n for i, n in spec]
+            labels = [self._units.str_spec(make_spec(zip(col, ns)))
+                      for col in uniq.T.tolist()]
+        else:
+            codes = np.zeros(flat.shape, dtype=int)
+            labels = [self._units.str_spec(())]
+        codes = codes.reshape(new_val.shape)
+        return new_val, codes.astype(np.min_scalar_type(len(labels))), labels
+
     def base_unitise(self, val, vector, dimensional=False):
         base_spec = self.calc_utypes(vector)
         new_val = val
         spec = []
-        for u in base_spec:
-            new_val, ut = self._base_unitise_one(new_val, u, dimensional)
-            spec.append(ut)
-        s = self._units.str_spec(spec)
+        for i, n in base_spec:
+            new_val, b = self._base_unitise_one(new_val, i, n, dimensional)
+            spec.append((b, n))
+        s = self._units.str_spec(make_spec(spec))
         return new_val, s
     
     def unitise_typed(self, val, spec):
         out = val
-        for u in spec:
-            out /= self._units.get_by_index(u).value
+        for i, n in spec:
+            out = _divide(self._units, out, i, n)
         s = self._units.str_spec(spec)
         return out, s
-    
+
+    def typed_factor(self, unit):
+        """ Return the scale factor and string for a unit 
+        
+        Args:
+            unit (str, Unit, tuple): A unit string, a Unit, or a spec.
+        
+        Returns:
+            tuple: The factor that values in base units must be multiplied
+            by to express them in the unit, and the unit string.
+        """
+        if isinstance(unit, str):
+            unit = self._units[unit]
+        spec = getattr(unit, 'spec', unit)
+        return self.unitise_typed(1.0, spec)
+
+    def unitise_typed_batch(self, groups):
+        out = []
+        for val, unit in groups:
+            factor, s = self.typed_factor(unit)
+            out.append((np.multiply(val, factor), s))
+        return out
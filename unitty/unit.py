@@ -9,6 +9,8 @@ Created on Fri May  1 11:51:58 2020
 from .quantity import Quantity
 
 class Unit(Quantity):
+    __slots__ = ()
+    
     def __str__(self):
         return self.str_in_base()
 
@@ -10,7 +10,13 @@ required.
 
 """
 
-from . import get_units
+import csv
+import itertools
+import math
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from . import get_units, get_system, get_systems, get_active, settings
+from . import namespace
 
 def split_str(s):
     """ Split out units from a string suffixed with units in square brackets
@@ -146,44 +152,384 @@ def transform_dict(dct):
     tups = [transform_pair(k, v) for k, v in dct.items()]
     return {k: v for k, v in tups}
 
-def transform_list_of_dicts(lst):
+def _key_factor(s, val):
+    """ Return the output key and scale factor for a key and sample value
+    
+    The units are chosen as for :func:`transform_pair`. The factor is None 
+    if the key has no units, can't be transformed, or is unchanged.
+    """
+    try:
+        ref, unit_str = split_str(s)
+        unit = get_units()[unit_str]
+        systems = get_systems(unit._parent)
+        base = val * unit.value
+        tup = systems.by_ref(base, ref)
+        if tup is not None:
+            new_k = add_unit(ref, tup[1])
+            factor = systems.by_ref(unit.value, ref)[0]
+        else:
+            factor, unit_str = systems.unitise_factor(base, unit.spec)
+            new_k = add_unit(ref, unit_str)
+            factor *= unit.value
+    except Exception:
+        return s, None
+    return new_k, None if factor == 1.0 else factor
+
+def _resolve_key(s, units):
+    """ Return the reference and Unit for a key, or None if it has none """
+    try:
+        ref, unitstr = split_str(s)
+        return ref, units[unitstr]
+    except Exception:
+        return None
+
+def _transform_resolved(s, val, resolved):
+    """ As for :func:`transform_pair`, but with a resolved key """
+    if resolved is None:
+        return s, val
+    ref, unit = resolved
+    try:
+        q = val << unit
+        q.set_ref(ref)
+        return split_qty(q)
+    except Exception:
+        return s, val
+
+def _transform_records(lst, keys):
+    """ Transform a list of dicts, resolving each distinct key once """
+    units = get_units()
+    out = []
+    for dct in lst:
+        d = {}
+        for k, v in dct.items():
+            if k not in keys:
+                keys[k] = _resolve_key(k, units)
+            new_k, new_v = _transform_resolved(k, v, keys[k])
+            d[new_k] = new_v
+        out.append(d)
+    return out
+
+_worker_keys = {} # The resolved keys in a worker process
+
+def _init_worker(group, units_raw, sys_raw, sys_name, refs, worker_settings):
+    """ Set up the namespace in a worker process """
+    namespace.setup(group, units_raw=units_raw, sys_raw=sys_raw)
+    namespace.set_system(sys_name, group)
+    get_systems(group).set_refs(refs)
+    settings.update(worker_settings)
+    _worker_keys.clear()
+
+def _transform_shard(lst):
+    return _transform_records(lst, _worker_keys)
+
+def transform_list_of_dicts(lst, processes=None):
     """ Transform a list of dictionaries into the current unit system
     
     Args:
         lst (list): A list of dictionaries as for the :func:`transform_dict`
             function.
+        processes (int): [Optional] The number of worker processes to share
+            the work between. If omitted, the list is transformed in this
+            process.
         
     Returns:
         list: A list of dictionaries, where each is the output of the 
         :func:`transform_dict` function.
         
+    Note:
+        The units in each key are parsed once for each distinct key, rather
+        than once per dictionary. Units are still chosen for each value.
+        
+        Each worker process sets up its own group with the same units,
+        systems, active system and references as the active group, so 
+        that the results are the same as without workers.
+        
     """
-    return [transform_dict(dct) for dct in lst]
+    if not processes:
+        return _transform_records(lst, {})
+    group = namespace._ensure_exists(get_active())
+    systems = get_systems(group)
+    initargs = (group, get_units(group).raw, systems.raw, systems.active_name,
+                systems._refs, dict(settings))
+    n = max(1, math.ceil(len(lst) / (processes * 4)))
+    shards = [lst[i:i+n] for i in range(0, len(lst), n)]
+    with ProcessPoolExecutor(processes, initializer=_init_worker,
+                             initargs=initargs) as executor:
+        results = executor.map(_transform_shard, shards)
+        return [dct for shard in results for dct in shard]
 
-def transform_df(df):
+class TransformPlan():
+    """ A precompiled transformation for dictionaries with the same keys
+    
+    Args:
+        source (dict, list): A sample dictionary, as for the 
+            :func:`transform_dict` function, or a list of keys. The units
+            for each key are chosen from the sample value. If a list of
+            keys is given, they are chosen as if each value was 1.
+    
+    A plan works out the output key and scale factor for each key once, 
+    so that applying it to each dictionary needs only lookups and 
+    multiplies. Keys that aren't in the plan, and values that can't be 
+    multiplied (e.g. None), are transformed as for :func:`transform_pair`.
+    
+    The units are chosen for the system that is active when the plan
+    is built. If the active system changes, :attr:`stale` becomes True, and
+    :meth:`build` should be called to rebuild the plan.
+    
+    Example:
+    ::
+        
+        plan = TransformPlan(records[0])
+        out = plan.apply_list(records)
+        
+    """
+    def __init__(self, source):
+        if isinstance(source, dict):
+            self._sample = dict(source)
+        else:
+            self._sample = {k: 1.0 for k in source}
+        self.build()
+        
+    def build(self):
+        """ Build or rebuild the plan for the active system """
+        self._systems = get_systems()
+        self._system_name = self._systems.active_name
+        self._plan = {}
+        for k, v in self._sample.items():
+            self._plan[k] = _key_factor(k, v)
+            
+    @property
+    def stale(self):
+        """ True if the active system has changed since the plan was built """
+        systems = get_systems()
+        return (systems is not self._systems
+                or systems.active_name != self._system_name)
+    
+    def __getitem__(self, key):
+        """ Return the output key and scale factor for a key """
+        return self._plan[key]
+    
+    def apply(self, dct):
+        """ Transform a dictionary into the units of the plan
+        
+        Args:
+            dct (dict): A dictionary as for the :func:`transform_dict` 
+                function. The values may be arrays.
+                
+        Returns:
+            dict: The transformed dictionary.
+        """
+        out = {}
+        plan = self._plan
+        for k, v in dct.items():
+            try:
+                new_k, factor = plan[k]
+                if factor is not None:
+                    v = v * factor
+            except (KeyError, TypeError):
+                # Keys not in the plan, or values that aren't numbers
+                new_k, v = transform_pair(k, v)
+            out[new_k] = v
+        return out
+    
+    def apply_list(self, lst):
+        """ Transform a list of dictionaries into the units of the plan
+        
+        Args:
+            lst (list): A list of dictionaries, as for :meth:`apply`.
+        
+        Returns:
+            list: A list of transformed dictionaries.
+        """
+        return [self.apply(dct) for dct in lst]
+        
+def _sample_mean(arr, sample_size):
+    """ Return the mean of evenly spaced samples from an array """
+    step = max(1, len(arr) // sample_size)
+    sample = arr[::step]
+    sample = sample[~np.isnan(sample)]
+    return np.mean(sample) if len(sample) > 0 else None
+
+def _scale_column(df, k, ratio):
+    """ Scale a dataframe column, in place if its buffer allows """
+    arr = df[k].to_numpy()
+    if arr.dtype.kind == 'f' and arr.flags.writeable:
+        np.multiply(arr, ratio, out=arr)
+    else:
+        df[k] = arr * ratio
+
+def transform_df(df, copy=True, sample_size=1000):
     """ Transform a pandas dataframe into the current unit system
     
     Args:
         df (DataFrame): A pandas dataframe. Column names with units should
             have them within square brackets at the end of each name.
+        copy (bool): [Optional] If True, the transformed data is put in a
+            copy of the dataframe. If False, the columns of df are renamed
+            and scaled in place, which avoids copying large tables.
+        sample_size (int): [Optional] The number of evenly spaced values in
+            each column whose mean is used to choose units.
         
     Returns:
         DataFrame: A dataframe in which the column units have been changed
         into the current unit system and the table values have been changed
-        into those new units.
+        into those new units. If copy is False, this is df.
+        
+    Note:
+        Columns that aren't numeric, or whose units don't change, are
+        left as they are.
         
     """
-    df2 = df.copy()
-    cols = list(df.columns)
-    dct = {k: df2[k].mean() for k in cols}
-    transformed = transform_dict(dct)
-    df2.columns = transformed.keys()
-    new_unit_values = [str_to_unit(k).value for k in transformed.keys()]
-    old_unit_values = [str_to_unit(k).value for k in cols]
-    ratios = [old/new for old, new in zip(old_unit_values, new_unit_values)]
-    transformed = {k: ratios[i] for i, k in enumerate(transformed.keys())}
-    for k, v in transformed.items():
-        df2[k] = df2[k] * v
+    df2 = df.copy() if copy else df
+    new_cols = []
+    for k in list(df2.columns):
+        arr = df2[k].to_numpy()
+        mean = None
+        if np.issubdtype(arr.dtype, np.number):
+            mean = _sample_mean(arr, sample_size)
+        new_k, factor = (k, None) if mean is None else _key_factor(k, mean)
+        if factor is not None:
+            _scale_column(df2, k, factor)
+        new_cols.append(new_k)
+    df2.columns = new_cols
     return df2
 
+def _to_floats(cells):
+    """ Return an array of floats, with NaN for cells that aren't numbers """
+    try:
+        return np.array(cells, dtype=float)
+    except ValueError:
+        pass
+    out = np.full(len(cells), np.nan)
+    for i, c in enumerate(cells):
+        try:
+            out[i] = float(c)
+        except ValueError:
+            pass
+    return out
 
+def _csv_factors(header, rows):
+    """ Return the new header and scale factor for each column of a csv """
+    new_header = []
+    factors = []
+    for i, k in enumerate(header):
+        vals = _to_floats([row[i] for row in rows if len(row) > i])
+        ok = ~np.isnan(vals)
+        if not ok.any():
+            new_header.append(k)
+            factors.append(1.0)
+            continue
+        new_k, factor = _key_factor(k, np.mean(vals[ok]))
+        new_header.append(new_k)
+        factors.append(1.0 if factor is None else factor)
+    return new_header, factors
+
+def _scale_rows(rows, factors):
+    """ Scale the columns of a list of csv rows 
+    
+    Rows may be blank or shorter or longer than the header. Only the cells
+    they have are scaled.
+    """
+    out = [list(row) for row in rows]
+    for i, factor in enumerate(factors):
+        if factor == 1.0:
+            continue
+        inds = [j for j, row in enumerate(out) if len(row) > i]
+        vals = _to_floats([out[j][i] for j in inds]) * factor
+        ok = ~np.isnan(vals)
+        for j, v, good in zip(inds, vals.tolist(), ok.tolist()):
+            if good:
+                out[j][i] = repr(v)
+    return out
+
+def iter_transform_csv(fname, chunksize=10000, **fmtparams):
+    """ Transform a csv file into the current unit system, row by row
+    
+    Args:
+        fname (str): The csv filename. The first row must contain the
+            column names. Those with units should have them within square
+            brackets at the end of each name (e.g. 'widget.length [mm]').
+        chunksize (int): [Optional] The number of rows to read at a time.
+        fmtparams: [Optional] Keyword arguments for the csv reader (e.g.
+            delimiter).
+            
+    Yields:
+        list: The transformed column names, then each transformed row as a
+        list of strings.
+        
+    Note:
+        The file is read one chunk at a time, so memory use does not depend
+        on the file size. The units for each column are chosen from the
+        mean of the first chunk, as :func:`transform_df` does for the
+        whole column. Cells that aren't numbers are returned unchanged, as
+        are blank rows and any cells missing from short rows.
+    """
+    with open(fname, 'r', newline='') as f:
+        reader = csv.reader(f, **fmtparams)
+        header = next(reader)
+        rows = list(itertools.islice(reader, chunksize))
+        new_header, factors = _csv_factors(header, rows)
+        yield new_header
+        while rows:
+            yield from _scale_rows(rows, factors)
+            rows = list(itertools.islice(reader, chunksize))
+
+def transform_csv(fname, out_fname, chunksize=10000, **fmtparams):
+    """ Transform a csv file into the current unit system
+    
+    Args:
+        fname (str): The csv filename. See :func:`iter_transform_csv`.
+        out_fname (str): The filename for the transformed csv.
+        chunksize (int): [Optional] The number of rows to read at a time.
+        fmtparams: [Optional] Keyword arguments for the csv reader and 
+            writer (e.g. delimiter).
+    """
+    with open(out_fname, 'w', newline='') as f:
+        writer = csv.writer(f, **fmtparams)
+        writer.writerows(iter_transform_csv(fname, chunksize, **fmtparams))
+
+def convert_array(src, unit, out=None, chunksize=65536):
+    """ Convert a large array from base units in chunks
+    
+    Args:
+        src (str, ndarray): An array, such as an np.memmap, of values in
+            base units (e.g. m, kg). Alternatively, the filename of a .npy
+            file, which is opened as a read-only memory-map.
+        unit (str, Unit): The units to convert the values into.
+        out (str, ndarray): [Optional] An array of the same shape as src 
+            to write the converted values into, or the filename of a .npy
+            file to create as a memory-map. If omitted, a new array is
+            created in memory.
+        chunksize (int): [Optional] The number of rows (items along the 
+            first axis) to convert at a time.
+            
+    Returns:
+        tuple: The output array and the unit string.
+        
+    Note:
+        Each chunk is multiplied directly into the output, so no full-size
+        intermediate arrays are created. The scale factor is the same one
+        used by :meth:`system.Systems.unitise_typed_batch`.
+        
+    Example:
+    ::
+        
+        out, unit_str = convert_array('pressures.npy', 'kPa',
+                                      out='pressures_kPa.npy')
+    """
+    if isinstance(src, str):
+        src = np.load(src, mmap_mode='r')
+    factor, unit_str = get_system().typed_factor(unit)
+    if out is None:
+        out = np.empty(src.shape, dtype=np.result_type(src, factor))
+    elif isinstance(out, str):
+        out = np.lib.format.open_memmap(out, mode='w+', shape=src.shape,
+                            dtype=np.result_type(src, factor))
+    if src.ndim == 0:
+        np.multiply(src, factor, out=out)
+    else:
+        for a in range(0, len(src), chunksize):
+            np.multiply(src[a:a+chunksize], factor, out=out[a:a+chunksize])
+    if isinstance(out, np.memmap):
+        out.flush()
+    return out, unit_str